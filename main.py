@@ -7,15 +7,16 @@ iteration intervals and error handling.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.config import Config, config
 from src.api_client import APIClient
 from src.proxy_manager import ProxyManager
-from src.browser_controller import BrowserController
-from src.registration import Registration
+from src.browser_controller import BrowserController, BrowserPool
+from src.registration import Registration, SubmitDispatcher
 from src.profile_update import ProfileUpdate
-from src.storage import Storage
+from src.storage import CheckpointStore, Storage
 from src.date_utils import generate_random_day
 from src.models import AccountRecord, UserData
 
@@ -54,8 +55,15 @@ class MainRunner:
         self.api_client = APIClient(self.config.API_URL)
         self.proxy_manager = ProxyManager(self.config)
         self.storage = Storage(self.config.OUTPUT_FILE)
+        self.checkpoints = CheckpointStore(self.config.CHECKPOINT_FILE)
+        self.submit_dispatcher = SubmitDispatcher(
+            self.config.SUBMIT_SHARDS,
+            self.config.SUBMIT_CONCURRENCY,
+            self.config.SUBMIT_SPACING_SEC
+        )
+        self._browser_pool: Optional[BrowserPool] = None
 
-    def run_single_iteration(self, iteration_num: int) -> bool:
+    def run_single_iteration(self, iteration_num: int) -> Optional[bool]:
         """Execute a single registration iteration.
         
         Performs the complete flow:
@@ -76,7 +84,8 @@ class MainRunner:
             iteration_num: Current iteration number (for logging)
             
         Returns:
-            True if registration was successful, False otherwise
+            True if registration was successful, None if the account was
+            already saved and the iteration was skipped, False otherwise
             
         Requirements: 8.1, 4.3, 4.4, 4.5
         """
@@ -89,6 +98,10 @@ class MainRunner:
             user_data = self.api_client.fetch_user_data()
             logger.info(f"User data fetched: {user_data.email}")
             
+            if user_data.email in self.storage:
+                logger.warning(f"Account {user_data.email} is already saved, skipping registration")
+                return None
+            
             # Step 2: Get valid US proxy
             logger.info("Getting valid US proxy...")
             proxy_url = self.proxy_manager.get_valid_us_proxy()
@@ -104,15 +117,29 @@ class MainRunner:
             
             # Step 4: Start browser with proxy
             logger.info("Starting browser...")
-            browser = BrowserController(proxy_url)
-            browser.start(headless=False)
+            if self._browser_pool:
+                # Fresh isolated context on the already running browser
+                browser = self._browser_pool.new_controller(proxy_url)
+            else:
+                browser = BrowserController(proxy_url)
+                browser.start(headless=False)
             logger.info("Browser started successfully")
             
             # Step 5: Execute registration
             logger.info("Starting registration flow...")
-            registration = Registration(browser)
+            registration = Registration(
+                browser, self.checkpoints, submit_dispatcher=self.submit_dispatcher
+            )
             registration_success = registration.register(user_data)
             
+            # Each retry resumes at the step that failed (Requirements 4.1-4.9)
+            for attempt in range(1, self.config.REGISTRATION_RETRIES + 1):
+                if registration_success:
+                    break
+                logger.info(f"Retrying registration ({attempt}/{self.config.REGISTRATION_RETRIES}) "
+                            f"from state: {registration.state.value}")
+                registration_success = registration.register(user_data)
+            
             if not registration_success:
                 # Registration failed - could be due to verification timeout (Requirements 4.3, 4.4)
                 logger.error("Registration failed - this may be due to manual verification timeout")
@@ -144,6 +171,7 @@ class MainRunner:
                 birthday=birthday
             )
             self.storage.save_success(record)
+            self.checkpoints.discard(user_data.email)
             logger.info(f"Account saved: {user_data.email}")
             
             return True
@@ -161,6 +189,41 @@ class MainRunner:
                 except Exception as e:
                     logger.warning(f"Error stopping browser: {e}")
 
+    def _run_iteration_safely(self, iteration_num: int, total: int) -> Optional[bool]:
+        """Run one iteration, logging its outcome and swallowing exceptions.
+        
+        Args:
+            iteration_num: Current iteration number
+            total: Total number of iterations (for logging)
+            
+        Returns:
+            True if the iteration succeeded, None if it was skipped,
+            False otherwise
+            
+        Requirements: 8.3, 4.3, 4.4, 4.5
+        """
+        logger.info(f"=== Iteration {iteration_num}/{total} ===")
+        
+        try:
+            # Run single iteration (Requirements 8.1)
+            success = self.run_single_iteration(iteration_num)
+            
+            if success:
+                logger.info(f"Iteration {iteration_num} completed successfully")
+            elif success is None:
+                logger.info(f"Iteration {iteration_num} skipped - account already saved")
+            else:
+                # Log failure - could be due to verification timeout (Requirements 4.3, 4.5)
+                logger.warning(f"Iteration {iteration_num} failed - possible causes: verification timeout, registration error, or profile update error")
+                logger.info(f"Proceeding to next iteration (Requirements 4.4)")
+            return success
+                
+        except Exception as e:
+            # Log error and continue to next iteration (Requirements 8.3, 4.4)
+            logger.error(f"Iteration {iteration_num} failed with exception: {e}")
+            logger.info(f"Proceeding to next iteration after exception")
+            return False
+
     def run(self) -> dict:
         """Execute batch registration for configured iteration count.
         
@@ -168,6 +231,12 @@ class MainRunner:
         between each iteration. Logs errors and continues to next
         iteration on failure.
         
+        With CONCURRENCY greater than 1, iterations run on a thread pool,
+        each driving its own browser. Iteration starts are still spaced by
+        ITERATION_INTERVAL, but a new one does not wait for the previous one
+        to finish. With REUSE_BROWSER (sequential runs only), one browser is
+        launched for the batch and each iteration gets a fresh context.
+        
         Handles manual verification timeouts by:
         - Logging timeout events when iterations fail
         - Continuing to next iteration after timeout
@@ -178,51 +247,66 @@ class MainRunner:
             - total: Total number of iterations
             - successful: Number of successful registrations
             - failed: Number of failed registrations
+            - skipped: Number of iterations skipped because the account
+              was already saved
             
         Requirements: 8.1, 8.2, 8.3, 4.3, 4.4, 4.5
         """
         total = self.config.ITERATION_COUNT
-        successful = 0
-        failed = 0
+        concurrency = max(1, self.config.CONCURRENCY)
         
         logger.info(f"Starting batch registration: {total} iterations")
         logger.info(f"Interval between iterations: {self.config.ITERATION_INTERVAL} seconds")
         
-        for i in range(1, total + 1):
-            logger.info(f"=== Iteration {i}/{total} ===")
+        if concurrency == 1:
+            if self.config.REUSE_BROWSER:
+                # One browser for the whole batch; iterations get fresh contexts
+                self._browser_pool = BrowserPool(headless=False)
+                self._browser_pool.start()
             
+            outcomes = []
             try:
-                # Run single iteration (Requirements 8.1)
-                success = self.run_single_iteration(i)
-                
-                if success:
-                    successful += 1
-                    logger.info(f"Iteration {i} completed successfully")
-                else:
-                    failed += 1
-                    # Log failure - could be due to verification timeout (Requirements 4.3, 4.5)
-                    logger.warning(f"Iteration {i} failed - possible causes: verification timeout, registration error, or profile update error")
-                    logger.info(f"Proceeding to next iteration (Requirements 4.4)")
+                for i in range(1, total + 1):
+                    outcomes.append(self._run_iteration_safely(i, total))
                     
-            except Exception as e:
-                # Log error and continue to next iteration (Requirements 8.3, 4.4)
-                failed += 1
-                logger.error(f"Iteration {i} failed with exception: {e}")
-                logger.info(f"Proceeding to next iteration after exception")
-            
-            # Wait for configured interval before next iteration (Requirements 8.2)
-            if i < total:
-                logger.info(f"Waiting {self.config.ITERATION_INTERVAL} seconds before next iteration...")
-                time.sleep(self.config.ITERATION_INTERVAL)
+                    # Wait for configured interval before next iteration (Requirements 8.2)
+                    if i < total:
+                        logger.info(f"Waiting {self.config.ITERATION_INTERVAL} seconds before next iteration...")
+                        time.sleep(self.config.ITERATION_INTERVAL)
+            finally:
+                if self._browser_pool:
+                    self._browser_pool.stop()
+                    self._browser_pool = None
+        else:
+            if self.config.REUSE_BROWSER:
+                logger.warning("REUSE_BROWSER is ignored when CONCURRENCY > 1; each worker starts its own browser")
+            logger.info(f"Running up to {concurrency} iterations concurrently")
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = []
+                for i in range(1, total + 1):
+                    futures.append(executor.submit(self._run_iteration_safely, i, total))
+                    
+                    # Space out iteration starts (Requirements 8.2)
+                    if i < total:
+                        time.sleep(self.config.ITERATION_INTERVAL)
+                outcomes = [future.result() for future in futures]
+        
+        successful = sum(1 for success in outcomes if success)
+        skipped = sum(1 for success in outcomes if success is None)
+        failed = total - successful - skipped
+        
+        # Make sure every saved account is on disk
+        self.storage.close()
         
         # Log final results
         logger.info("=== Batch Registration Complete ===")
-        logger.info(f"Total: {total}, Successful: {successful}, Failed: {failed}")
+        logger.info(f"Total: {total}, Successful: {successful}, Failed: {failed}, Skipped: {skipped}")
         
         return {
             "total": total,
             "successful": successful,
-            "failed": failed
+            "failed": failed,
+            "skipped": skipped
         }
 
 
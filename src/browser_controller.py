@@ -7,9 +7,12 @@ PerimeterX bypass settings.
 
 import re
 import random
+import sys
 import time
-from typing import Optional, Callable, Any, List
+from functools import lru_cache
+from typing import Optional, Callable, Any, List, Tuple
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 
 # Valid English month names for profile update
@@ -19,6 +22,45 @@ VALID_MONTHS = [
 ]
 
 
+# Fills (selector_or_prefix, value, is_prefix) specs in one round-trip. All
+# elements are resolved before any is touched so a missing field leaves the
+# form unchanged. Uses the native value setter so framework-bound inputs see
+# the change, then fires input/change like a user edit would.
+_FILL_BATCH_JS = """(fields) => {
+    const elements = fields.map(([target, , isPrefix]) =>
+        document.querySelector(isPrefix ? `[id^="${target}"]` : target));
+    if (elements.some((element) => !element)) {
+        return false;
+    }
+    elements.forEach((element, i) => {
+        const proto = Object.getPrototypeOf(element);
+        const setter = Object.getOwnPropertyDescriptor(proto, "value").set;
+        element.focus();
+        setter.call(element, fields[i][1]);
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+        element.blur();
+    });
+    return true;
+}"""
+
+
+# Maps each dynamic ID base pattern to the full ID of its first match (or null)
+_RESOLVE_DYNAMIC_IDS_JS = """(patterns) => Object.fromEntries(patterns.map((pattern) => {
+    const element = document.querySelector(`[id^="${pattern}"]`);
+    return [pattern, element ? element.id : null];
+}))"""
+
+
+# True if any element matching the (grouped) selector is rendered and not hidden
+_ANY_VISIBLE_JS = """(selector) => Array.from(document.querySelectorAll(selector)).some((element) => {
+    const rect = element.getBoundingClientRect();
+    const style = getComputedStyle(element);
+    return rect.width > 0 && rect.height > 0
+        && style.visibility !== "hidden" && style.display !== "none";
+})"""
+
+
 def is_valid_month(month: str) -> bool:
     """Check if a month name is valid.
     
@@ -31,6 +73,7 @@ def is_valid_month(month: str) -> bool:
     return month in VALID_MONTHS
 
 
+@lru_cache(maxsize=None)
 def build_dynamic_id_selector(base_pattern: str, suffix_length: int = 12) -> str:
     """Build a CSS selector for elements with dynamic ID suffixes.
     
@@ -54,12 +97,125 @@ def matches_dynamic_id_pattern(element_id: str, base_pattern: str) -> bool:
     Returns:
         True if the element ID matches the pattern with a 12-digit suffix
     """
-    if not element_id.startswith(base_pattern):
+    # Reject on length before slicing; most mismatches fail here
+    if len(element_id) - len(base_pattern) != 12 or not element_id.startswith(base_pattern):
         return False
     
-    suffix = element_id[len(base_pattern):]
     # Check if suffix is exactly 12 alphanumeric characters
-    return len(suffix) == 12 and suffix.isalnum()
+    return element_id[len(base_pattern):].isalnum()
+
+
+def _launch_options(headless: bool) -> dict:
+    """Build Chromium launch options with anti-detection arguments.
+    
+    Args:
+        headless: Whether to run browser in headless mode
+        
+    Returns:
+        Keyword arguments for chromium.launch
+    """
+    # Configure launch options with comprehensive anti-detection args
+    launch_options = {
+        "headless": headless,
+        "args": [
+            # Core anti-detection
+            "--disable-blink-features=AutomationControlled",
+            "--disable-automation",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-setuid-sandbox",
+            "--disable-infobars",
+            
+            # Window and display
+            "--window-size=1920,1080",
+            "--start-maximized",
+            
+            # Disable automation flags
+            "--disable-extensions",
+            "--disable-default-apps",
+            "--disable-component-extensions-with-background-pages",
+            
+            # WebGL and GPU
+            "--enable-webgl",
+            "--use-gl=swiftshader",
+            "--enable-accelerated-2d-canvas",
+            
+            # Network
+            "--disable-features=IsolateOrigins,site-per-process",
+            "--disable-site-isolation-trials",
+            
+            # Privacy and fingerprinting
+            "--disable-features=AudioServiceOutOfProcess",
+            "--disable-features=TranslateUI",
+            
+            # Performance
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-breakpad",
+            "--disable-client-side-phishing-detection",
+            "--disable-component-update",
+            "--disable-hang-monitor",
+            "--disable-ipc-flooding-protection",
+            "--disable-popup-blocking",
+            "--disable-prompt-on-repost",
+            "--disable-renderer-backgrounding",
+            "--disable-sync",
+            "--metrics-recording-only",
+            "--no-first-run",
+            "--password-store=basic",
+            "--use-mock-keychain",
+            
+            # Exclude automation switches
+            "--excludeSwitches=enable-automation",
+        ]
+    }
+    
+    return launch_options
+
+
+def _context_options(proxy_url: Optional[str]) -> dict:
+    """Build browser context options, routing through the proxy if given.
+    
+    Args:
+        proxy_url: Optional proxy URL for the context
+        
+    Returns:
+        Keyword arguments for browser.new_context
+    """
+    context_options = {
+        "viewport": {"width": 1920, "height": 1080},
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "color_scheme": "light",
+        "reduced_motion": "no-preference",
+        "has_touch": False,
+        "is_mobile": False,
+        "device_scale_factor": 1,
+        "java_script_enabled": True,
+        "bypass_csp": False,
+        "extra_http_headers": {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Cache-Control": "max-age=0",
+            "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+            "Sec-Ch-Ua-Mobile": "?0",
+            "Sec-Ch-Ua-Platform": '"Windows"',
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Upgrade-Insecure-Requests": "1",
+        },
+        "permissions": ["geolocation"],
+        "geolocation": {"latitude": 40.7128, "longitude": -74.0060},  # New York
+    }
+    
+    if proxy_url:
+        context_options["proxy"] = {"server": proxy_url}
+    return context_options
 
 
 class BrowserController:
@@ -84,7 +240,9 @@ class BrowserController:
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         self._monitored_urls: List[str] = []
+        self._monitored_re: Optional[re.Pattern] = None
         self._captured_responses: List[Response] = []
+        self._owns_browser = True
     
     def _configure_stealth(self, context: BrowserContext) -> None:
         """Configure stealth settings to evade PerimeterX detection.
@@ -464,107 +622,31 @@ class BrowserController:
         Requirements: 3.1, 3.2
         """
         self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(**_launch_options(headless))
+        self._owns_browser = True
+        self._open_context()
+    
+    def attach(self, browser: Browser) -> None:
+        """Open a fresh context on a browser owned by someone else.
         
-        # Configure launch options with comprehensive anti-detection args
-        launch_options = {
-            "headless": headless,
-            "args": [
-                # Core anti-detection
-                "--disable-blink-features=AutomationControlled",
-                "--disable-automation",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-infobars",
-                
-                # Window and display
-                "--window-size=1920,1080",
-                "--start-maximized",
-                
-                # Disable automation flags
-                "--disable-extensions",
-                "--disable-default-apps",
-                "--disable-component-extensions-with-background-pages",
-                
-                # WebGL and GPU
-                "--enable-webgl",
-                "--use-gl=swiftshader",
-                "--enable-accelerated-2d-canvas",
-                
-                # Network
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-site-isolation-trials",
-                
-                # Privacy and fingerprinting
-                "--disable-features=AudioServiceOutOfProcess",
-                "--disable-features=TranslateUI",
-                
-                # Performance
-                "--disable-background-networking",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-breakpad",
-                "--disable-client-side-phishing-detection",
-                "--disable-component-update",
-                "--disable-hang-monitor",
-                "--disable-ipc-flooding-protection",
-                "--disable-popup-blocking",
-                "--disable-prompt-on-repost",
-                "--disable-renderer-backgrounding",
-                "--disable-sync",
-                "--metrics-recording-only",
-                "--no-first-run",
-                "--password-store=basic",
-                "--use-mock-keychain",
-                
-                # Exclude automation switches
-                "--excludeSwitches=enable-automation",
-            ]
-        }
-        
-        self._browser = self._playwright.chromium.launch(**launch_options)
+        Used by BrowserPool; stop() then closes only this controller's page
+        and context and leaves the shared browser running.
         
-        # Configure context options with proxy if provided
-        context_options = {
-            "viewport": {"width": 1920, "height": 1080},
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "locale": "en-US",
-            "timezone_id": "America/New_York",
-            "color_scheme": "light",
-            "reduced_motion": "no-preference",
-            "has_touch": False,
-            "is_mobile": False,
-            "device_scale_factor": 1,
-            "java_script_enabled": True,
-            "bypass_csp": False,
-            "extra_http_headers": {
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Cache-Control": "max-age=0",
-                "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": '"Windows"',
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-User": "?1",
-                "Upgrade-Insecure-Requests": "1",
-            },
-            "permissions": ["geolocation"],
-            "geolocation": {"latitude": 40.7128, "longitude": -74.0060},  # New York
-        }
-        
-        if self.proxy_url:
-            context_options["proxy"] = {"server": self.proxy_url}
-        
-        self._context = self._browser.new_context(**context_options)
+        Args:
+            browser: Already launched browser to open the context on
+        """
+        self._browser = browser
+        self._owns_browser = False
+        self._open_context()
+    
+    def _open_context(self) -> None:
+        """Create the stealth-configured context and page on the current browser."""
+        self._context = self._browser.new_context(**_context_options(self.proxy_url))
         self._configure_stealth(self._context)
         self._page = self._context.new_page()
         
         # Set up response monitoring
         self._page.on("response", self._on_response)
-
     
     def _on_response(self, response: Response) -> None:
         """Handle response events for URL monitoring.
@@ -572,12 +654,24 @@ class BrowserController:
         Args:
             response: The response object from Playwright
         """
-        for url_pattern in self._monitored_urls:
-            if url_pattern in response.url:
-                self._captured_responses.append(response)
+        # Runs for every response the page receives; one precompiled search
+        # covers all monitored patterns
+        if self._monitored_re is not None and self._monitored_re.search(response.url):
+            self._captured_responses.append(response)
+    
+    def _compile_monitored_urls(self) -> None:
+        """Rebuild the matcher used by _on_response from the monitored patterns."""
+        if self._monitored_urls:
+            self._monitored_re = re.compile("|".join(map(re.escape, self._monitored_urls)))
+        else:
+            self._monitored_re = None
     
     def stop(self) -> None:
-        """Stop the browser and clean up resources."""
+        """Stop the browser and clean up resources.
+        
+        A browser attached from a BrowserPool is left running; only this
+        controller's page and context are closed.
+        """
         if self._page:
             self._page.close()
             self._page = None
@@ -585,7 +679,8 @@ class BrowserController:
             self._context.close()
             self._context = None
         if self._browser:
-            self._browser.close()
+            if self._owns_browser:
+                self._browser.close()
             self._browser = None
         if self._playwright:
             self._playwright.stop()
@@ -606,6 +701,37 @@ class BrowserController:
         
         self._page.goto(url, wait_until=wait_until, timeout=self.PAGE_LOAD_TIMEOUT)
     
+    def follow_link(self, selector: str, url_glob: str, timeout: Optional[int] = None) -> bool:
+        """Click an in-page link and wait for the resulting URL.
+        
+        Cheaper than navigate() when the current page already links to the
+        target, since the click reuses the page's session and connections.
+        
+        Args:
+            selector: CSS selector for the link
+            url_glob: Glob the URL must match after the click (e.g. "**/profile**")
+            timeout: Maximum time to wait in milliseconds
+            
+        Returns:
+            True if the link was found and the URL matched, False otherwise
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+        
+        try:
+            link = self._page.locator(selector).first
+            if link.count() == 0:
+                return False
+            link.click()
+            self._page.wait_for_url(
+                url_glob,
+                wait_until="domcontentloaded",
+                timeout=timeout or self.PAGE_LOAD_TIMEOUT
+            )
+            return True
+        except Exception:
+            return False
+    
     def refresh(self) -> None:
         """Refresh the current page."""
         if not self._page:
@@ -646,18 +772,19 @@ class BrowserController:
         delay = random.randint(min_ms, max_ms) / 1000.0
         time.sleep(delay)
     
-    def _human_type(self, selector: str, value: str) -> None:
+    def _human_type(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
         """Type text with human-like delays between keystrokes.
         
         Args:
             selector: CSS selector for the input element
             value: Value to type
+            timeout: Maximum time in milliseconds to wait for the element
         """
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
         
-        # Click on the element first
-        self._page.click(selector)
+        # Click on the element first; the click auto-waits until it is actionable
+        self._page.click(selector, timeout=timeout or self.ELEMENT_TIMEOUT)
         self._human_delay(100, 300)
         
         # Clear existing content
@@ -704,21 +831,29 @@ class BrowserController:
         
         self._human_delay(100, 300)
     
-    def fill_input(self, selector: str, value: str, human_like: bool = True) -> None:
+    def fill_input(self, selector: str, value: str, human_like: bool = True,
+                   timeout: Optional[int] = None) -> None:
         """Fill an input field with a value.
         
+        Playwright auto-waits for the element to be visible and enabled, so
+        callers do not need a separate wait_for_element call.
+        
         Args:
             selector: CSS selector for the input element
             value: Value to fill in the input
             human_like: Whether to use human-like typing (default True)
+            timeout: Maximum time in milliseconds to wait for the element
+            
+        Raises:
+            PlaywrightTimeoutError: If the element does not become actionable in time
         """
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
         
         if human_like:
-            self._human_type(selector, value)
+            self._human_type(selector, value, timeout)
         else:
-            self._page.fill(selector, value)
+            self._page.fill(selector, value, timeout=timeout or self.ELEMENT_TIMEOUT)
     
     def fill_input_by_dynamic_id(self, base_pattern: str, value: str, human_like: bool = True) -> bool:
         """Fill an input field that has a dynamic ID suffix.
@@ -745,6 +880,48 @@ class BrowserController:
             return True
         return False
     
+    def resolve_dynamic_ids(self, base_patterns: List[str]) -> dict:
+        """Resolve the full IDs of several dynamic-ID elements in one call.
+        
+        Args:
+            base_patterns: Base ID patterns (e.g., "dwfrm_profile_login_password_")
+            
+        Returns:
+            Dictionary mapping each base pattern to the matching element ID, or
+            None if no element matched. Empty if the lookup itself failed.
+            
+        Requirements: 4.3, 4.4
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+        
+        try:
+            return self._page.evaluate(_RESOLVE_DYNAMIC_IDS_JS, list(base_patterns))
+        except Exception:
+            return {}
+    
+    def fill_form_batch(self, fields: List[Tuple[str, str, bool]]) -> bool:
+        """Fill several input fields with a single page script.
+        
+        Avoids one browser round-trip per field, at the cost of skipping
+        human-like typing.
+        
+        Args:
+            fields: List of (selector_or_prefix, value, is_prefix) tuples. When
+                    is_prefix is True the first item is a dynamic ID base pattern.
+                    
+        Returns:
+            True if every field was found and filled, False if any was missing
+            (in which case nothing is filled)
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+        
+        try:
+            return bool(self._page.evaluate(_FILL_BATCH_JS, [list(field) for field in fields]))
+        except Exception:
+            return False
+    
     def click_button(self, selector: str, human_like: bool = True) -> None:
         """Click a button element.
         
@@ -788,6 +965,7 @@ class BrowserController:
         """
         if url_pattern not in self._monitored_urls:
             self._monitored_urls.append(url_pattern)
+            self._compile_monitored_urls()
     
     def stop_monitoring(self, url_pattern: str) -> None:
         """Stop monitoring a URL pattern.
@@ -797,6 +975,23 @@ class BrowserController:
         """
         if url_pattern in self._monitored_urls:
             self._monitored_urls.remove(url_pattern)
+            self._compile_monitored_urls()
+    
+    def arm_response_waiter(self, url_pattern: str) -> None:
+        """Start capturing responses for a URL pattern ahead of the action
+        that triggers them.
+        
+        Call this before e.g. clicking submit so a response that arrives
+        before wait_for_response_with_data subscribes is not missed.
+        Responses previously captured for the pattern are discarded.
+        
+        Args:
+            url_pattern: URL pattern to capture responses for
+        """
+        self._captured_responses = [
+            r for r in self._captured_responses if url_pattern not in r.url
+        ]
+        self.monitor_request(url_pattern)
     
     def clear_captured_responses(self) -> None:
         """Clear all captured responses."""
@@ -873,13 +1068,18 @@ class BrowserController:
                                      timeout: Optional[int] = None) -> Optional[dict]:
         """Wait for a response and return status code and body data.
         
+        If the pattern was armed with arm_response_waiter and a matching
+        response has already been captured, it is returned without waiting.
+        
         Args:
             url_pattern: URL pattern to wait for
             status_code: Optional HTTP status code to match
             timeout: Maximum time to wait in milliseconds
             
         Returns:
-            Dictionary with 'status', 'url', 'headers', and 'body' if found, None if timeout
+            Dictionary with 'status', 'url', 'headers', and 'body' if found, None if timeout.
+            'headers' and 'body' are zero-argument callables so the response
+            body is only read from the browser when a caller needs it.
         """
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
@@ -892,22 +1092,25 @@ class BrowserController:
                     return False
                 return True
             
-            response = self._page.wait_for_event(
-                "response",
-                predicate=predicate,
-                timeout=timeout or self.PAGE_LOAD_TIMEOUT
-            )
+            response = next(filter(predicate, self._captured_responses), None)
+            if response is None:
+                response = self._page.wait_for_event(
+                    "response",
+                    predicate=predicate,
+                    timeout=timeout or self.PAGE_LOAD_TIMEOUT
+                )
             
-            # Try to get response body
-            try:
-                body = response.text()
-            except Exception:
-                body = ""
+            def body() -> str:
+                # Try to get response body
+                try:
+                    return response.text()
+                except Exception:
+                    return ""
             
             return {
                 "status": response.status,
                 "url": response.url,
-                "headers": dict(response.headers),
+                "headers": lambda: dict(response.headers),
                 "body": body
             }
         except Exception:
@@ -959,7 +1162,9 @@ class BrowserController:
         
         This method checks for the presence of challenge elements using the
         provided list of CSS selectors. It's used to detect when a challenge
-        appears or disappears.
+        appears or disappears. The selectors are combined into one selector
+        list and checked in a single page call; if that fails (e.g. one
+        selector is malformed), each selector is checked individually.
         
         Args:
             selectors: List of CSS selectors to check for challenge elements
@@ -975,6 +1180,12 @@ class BrowserController:
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
         
+        try:
+            return bool(self._page.evaluate(_ANY_VISIBLE_JS, ", ".join(selectors)))
+        except Exception:
+            # Fall back to checking selectors one by one
+            pass
+        
         for selector in selectors:
             try:
                 element = self._page.locator(selector)
@@ -1004,3 +1215,61 @@ class BrowserController:
         if not self._page:
             return ""
         return self._page.url
+
+
+class BrowserPool:
+    """Keeps one browser process running and hands out a fresh context per account.
+    
+    Contexts are cookie- and storage-isolated, so each account still starts
+    from a clean profile, but Chromium is launched once per batch instead of
+    once per account. Each context can use its own proxy.
+    
+    Not thread-safe: Playwright's sync API must be driven from the thread
+    that started it.
+    """
+    
+    def __init__(self, headless: bool = True):
+        """Initialize BrowserPool.
+        
+        Args:
+            headless: Whether to run the shared browser in headless mode
+        """
+        self.headless = headless
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+    
+    def start(self) -> None:
+        """Launch the shared browser."""
+        launch_options = _launch_options(self.headless)
+        if sys.platform == "win32":
+            # Chromium on Windows only honours per-context proxies when a
+            # global one is set at launch; it is never used directly
+            launch_options["proxy"] = {"server": "http://per-context"}
+        
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(**launch_options)
+    
+    def new_controller(self, proxy_url: Optional[str] = None) -> BrowserController:
+        """Create a controller with a fresh context on the shared browser.
+        
+        Args:
+            proxy_url: Optional proxy URL for the new context
+            
+        Returns:
+            Started BrowserController; its stop() closes only its context
+        """
+        if not self._browser:
+            raise RuntimeError("Browser pool not started. Call start() first.")
+        
+        controller = BrowserController(proxy_url)
+        controller.attach(self._browser)
+        return controller
+    
+    def stop(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        if self._browser:
+            self._browser.close()
+            self._browser = None
+        if self._playwright:
+            self._playwright.stop()
+            self._playwright = None
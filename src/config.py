@@ -22,13 +22,23 @@ class Config:
     
     # Registration Configuration
     MONTH: str = "January"
+    REGISTRATION_RETRIES: int = 0  # extra register() attempts; each resumes at the failed step
     
     # Iteration Configuration
     ITERATION_COUNT: int = 10
     ITERATION_INTERVAL: int = 30  # seconds between iterations
+    CONCURRENCY: int = 1  # registrations running at once, each in its own browser
+    REUSE_BROWSER: bool = False  # sequential runs: one browser, fresh context per account
+    SUBMIT_CONCURRENCY: int = 1  # form submissions allowed in flight at once
+    SUBMIT_SPACING_SEC: float = 0.0  # minimum gap between consecutive submissions
+    SUBMIT_SHARDS: int = 1  # power of two; submits are gated per proxy shard
     
     # Output Configuration
     OUTPUT_FILE: str = "accounts.txt"
+    CHECKPOINT_FILE: str = "checkpoints.json"  # emails submitted but not yet saved
+    
+    # Form Fill Configuration
+    BATCH_FORM_FILL: bool = False  # fill all fields in one page script instead of typing
     
     # PerimeterX Configuration
     PX_APP_ID: str = "pxjbdhncwl"
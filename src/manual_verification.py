@@ -8,8 +8,8 @@ pausing automation and waiting for user to complete verification manually.
 import time
 import logging
 from dataclasses import dataclass, asdict, field
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional, List
 
 from src.browser_controller import BrowserController
 
@@ -18,17 +18,37 @@ from src.browser_controller import BrowserController
 logger = logging.getLogger(__name__)
 
 
+def poll_intervals(initial: float = 0.2, factor: float = 1.5, cap: float = 2.0) -> Iterator[float]:
+    """Yield an exponential backoff schedule for polling loops.
+    
+    Args:
+        initial: First interval in seconds
+        factor: Multiplier applied after each interval
+        cap: Upper bound for any single interval in seconds
+        
+    Yields:
+        Sleep intervals in seconds: initial, initial*factor, ... capped at cap
+    """
+    interval = initial
+    while True:
+        yield interval
+        interval = min(interval * factor, cap)
+
+
 @dataclass
 class VerificationEvent:
     """验证事件记录
     
     Records details about a verification event including challenge type,
-    timing information, and outcome status.
+    timing information, and outcome status. Durations are measured with the
+    monotonic clock, so wall-clock adjustments during a long manual
+    verification do not distort them.
     
     Attributes:
         challenge_type: Type of challenge detected (e.g., "press-and-hold", "checkbox")
         start_time: Timestamp when verification started
-        end_time: Timestamp when verification ended (None if still in progress)
+        end_time: Timestamp when verification ended, start_time plus the
+            measured duration (None if still in progress)
         success: Whether verification completed successfully
         timeout: Whether verification timed out
         duration_seconds: Total duration of verification in seconds
@@ -44,6 +64,10 @@ class VerificationEvent:
     duration_seconds: float = 0.0
     failure_reason: str = ""
     
+    def __post_init__(self) -> None:
+        # Not a dataclass field, so it stays out of to_dict() and comparisons
+        self._start_ns = time.monotonic_ns()
+    
     def to_dict(self) -> dict:
         """Convert VerificationEvent to dictionary format.
         
@@ -64,13 +88,12 @@ class VerificationEvent:
             timeout: Whether verification timed out
             failure_reason: Reason for failure if applicable
         """
-        self.end_time = datetime.now()
+        duration = (time.monotonic_ns() - self._start_ns) / 1e9
         self.success = success
         self.timeout = timeout
         self.failure_reason = failure_reason
-        # Ensure duration is always non-negative (handle clock skew or test scenarios)
-        duration = (self.end_time - self.start_time).total_seconds()
         self.duration_seconds = max(0.0, duration)
+        self.end_time = self.start_time + timedelta(seconds=self.duration_seconds)
 
 
 class BrowserCrashedError(Exception):
@@ -111,21 +134,35 @@ class ManualVerificationHandler:
         'div[class*="px-captcha"]',
     ]
     
-    def __init__(self, browser: BrowserController, timeout: int = 120, max_attempts: int = 3):
+    def __init__(self, browser: BrowserController, timeout: int = 120, max_attempts: int = 3,
+                 sleep_fn: Optional[Callable[[float], None]] = None,
+                 clock_fn: Optional[Callable[[], float]] = None):
         """Initialize ManualVerificationHandler.
         
         Args:
             browser: BrowserController instance for page interaction
             timeout: Maximum time to wait for manual verification in seconds (default 120)
             max_attempts: Maximum number of verification attempts allowed (default 3)
+            sleep_fn: Function used to wait between checks (default time.sleep)
+            clock_fn: Function returning the current time in seconds (default time.time)
         """
         self.browser = browser
         self.timeout = timeout
         self.max_attempts = max_attempts
+        self._sleep_fn = sleep_fn
+        self._clock_fn = clock_fn
         self.verification_count = 0
         self.events: List[VerificationEvent] = []
         self._fallback_log_messages: List[str] = []  # Fallback for when file logging fails
     
+    def _sleep(self, seconds: float) -> None:
+        """Wait using the injected sleep function, or time.sleep."""
+        (self._sleep_fn or time.sleep)(seconds)
+    
+    def _now(self) -> float:
+        """Read the injected clock, or time.time."""
+        return (self._clock_fn or time.time)()
+    
     def detect_challenge(self) -> Optional[str]:
         """Detect PerimeterX challenge on the current page.
         
@@ -140,14 +177,14 @@ class ManualVerificationHandler:
         if not self.browser.page:
             return None
         
-        detection_start = time.time()
+        detection_start = self._now()
         detection_timeout = 3.0  # 3 seconds timeout for detection
         
         try:
             # Check each selector with a short timeout
             for selector in self.PX_SELECTORS:
                 # Check if we've exceeded the detection timeout
-                elapsed = time.time() - detection_start
+                elapsed = self._now() - detection_start
                 if elapsed >= detection_timeout:
                     logger.debug(f"Challenge detection timeout reached after {elapsed:.2f}s")
                     return None
@@ -186,6 +223,14 @@ class ManualVerificationHandler:
             logger.warning(f"Error during challenge detection: {e}")
             return None
     
+    def _is_challenge_visible(self) -> bool:
+        """Check whether any PerimeterX challenge element is visible.
+        
+        Returns:
+            True if a challenge element is visible, False otherwise
+        """
+        return self.browser.is_challenge_present(self.PX_SELECTORS)
+    
     def wait_for_manual_verification(self, expected_url_pattern: str) -> bool:
         """Wait for user to complete manual verification.
         
@@ -204,11 +249,14 @@ class ManualVerificationHandler:
         if not self.browser.page:
             return False
         
-        start_time = time.time()
-        check_interval = 1.0  # Check every second
+        start_time = self._now()
+        # Poll quickly at first, then back off; restart the schedule whenever
+        # the page navigates since that is when completion is most likely
+        intervals = poll_intervals()
+        last_url = None
         
         while True:
-            elapsed = time.time() - start_time
+            elapsed = self._now() - start_time
             
             # Check for timeout
             if elapsed >= self.timeout:
@@ -218,30 +266,24 @@ class ManualVerificationHandler:
             try:
                 # Check if URL matches expected pattern
                 current_url = self.browser.current_url
+                if current_url != last_url:
+                    if last_url is not None:
+                        intervals = poll_intervals()
+                    last_url = current_url
                 if expected_url_pattern in current_url:
                     logger.info(f"Verification complete - URL changed to: {current_url}")
                     return True
                 
                 # Check if challenge elements disappeared
-                challenge_present = False
-                for selector in self.PX_SELECTORS:
-                    try:
-                        element = self.browser.page.locator(selector)
-                        if element.count() > 0 and element.first.is_visible():
-                            challenge_present = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not challenge_present:
+                if not self._is_challenge_visible():
                     logger.info("Verification complete - challenge elements disappeared")
                     return True
                 
             except Exception as e:
                 logger.warning(f"Error during verification monitoring: {e}")
             
-            # Wait before next check
-            time.sleep(check_interval)
+            # Wait before next check, without sleeping past the timeout
+            self._sleep(min(next(intervals), self.timeout - elapsed))
     
     def display_notification(self, challenge_type: str, remaining_time: Optional[int] = None) -> None:
         """Display notification to user about manual verification requirement.
@@ -471,9 +513,9 @@ class ManualVerificationHandler:
         self.log_verification_entry(self.timeout)
         
         # Wait for manual verification
-        start_time = time.time()
+        start_time = self._now()
         success = self.wait_for_manual_verification(expected_url_pattern)
-        duration = time.time() - start_time
+        duration = self._now() - start_time
         
         # Log result
         if success:
@@ -707,7 +749,7 @@ class ManualVerificationHandler:
                 return False
             
             self.browser.refresh()
-            time.sleep(2)  # Wait for page to load
+            self._sleep(2)  # Wait for page to load
             
             # Re-check state after refresh
             current_url = self.browser.current_url
@@ -797,13 +839,14 @@ class ManualVerificationHandler:
             )
             return False
         
-        start_time = time.time()
-        check_interval = 1.0  # Check every second
+        start_time = self._now()
+        intervals = poll_intervals()
+        last_url = None
         last_browser_check = start_time
         browser_check_interval = 5.0  # Check browser health every 5 seconds
         
         while True:
-            elapsed = time.time() - start_time
+            elapsed = self._now() - start_time
             
             # Check for timeout
             if elapsed >= self.timeout:
@@ -814,23 +857,27 @@ class ManualVerificationHandler:
                 return False
             
             # Periodic browser health check
-            if time.time() - last_browser_check >= browser_check_interval:
+            if self._now() - last_browser_check >= browser_check_interval:
                 if not self._check_browser_alive():
                     # Browser is not responsive
                     try:
                         # Try one more time to confirm
-                        time.sleep(1)
+                        self._sleep(1)
                         if not self._check_browser_alive():
                             # Browser definitely crashed or was closed
                             self.handle_browser_crash(event)
                     except Exception:
                         self.handle_browser_crash(event)
                 
-                last_browser_check = time.time()
+                last_browser_check = self._now()
             
             try:
                 # Check if URL matches expected pattern
                 current_url = self.browser.current_url
+                if current_url != last_url:
+                    if last_url is not None:
+                        intervals = poll_intervals()
+                    last_url = current_url
                 if expected_url_pattern in current_url:
                     self._safe_log(
                         f"[MANUAL_VERIFICATION] Verification complete - URL changed to: {current_url}",
@@ -839,17 +886,7 @@ class ManualVerificationHandler:
                     return True
                 
                 # Check if challenge elements disappeared
-                challenge_present = False
-                for selector in self.PX_SELECTORS:
-                    try:
-                        element = self.browser.page.locator(selector)
-                        if element.count() > 0 and element.first.is_visible():
-                            challenge_present = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not challenge_present:
+                if not self._is_challenge_visible():
                     self._safe_log(
                         "[MANUAL_VERIFICATION] Verification complete - challenge elements disappeared",
                         "info"
@@ -874,5 +911,5 @@ class ManualVerificationHandler:
                     if not self._check_browser_alive():
                         self.handle_browser_crash(event)
             
-            # Wait before next check
-            time.sleep(check_interval)
+            # Wait before next check, without sleeping past the timeout
+            self._sleep(min(next(intervals), self.timeout - elapsed))
@@ -4,7 +4,7 @@ Data models for Ralph Lauren Auto Register System.
 Contains dataclasses for user data, proxy validation results, and account records.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional
 import json
@@ -29,7 +29,7 @@ class UserData:
     
     def to_json(self) -> str:
         """Serialize UserData to JSON string."""
-        return json.dumps(asdict(self))
+        return json.dumps({name: getattr(self, name) for name in _FIELD_NAMES["UserData"]})
     
     @classmethod
     def from_json(cls, json_str: str) -> "UserData":
@@ -82,7 +82,7 @@ class AccountRecord:
     
     def to_json(self) -> str:
         """Serialize AccountRecord to JSON string."""
-        data = asdict(self)
+        data = {name: getattr(self, name) for name in _FIELD_NAMES["AccountRecord"]}
         data["created_at"] = self.created_at.isoformat()
         return json.dumps(data)
     
@@ -99,11 +99,24 @@ class AccountRecord:
     
     @classmethod
     def from_line(cls, line: str) -> "AccountRecord":
-        """Parse AccountRecord from a storage line."""
-        parts = line.strip().split("|")
+        """Parse AccountRecord from a storage line.
+        
+        Splits off the fixed fields from both ends with bounded splits, so a
+        password containing "|" still parses correctly.
+        """
+        head, birthday, created_at = line.strip().rsplit("|", 2)
+        email, password = head.split("|", 1)
         return cls(
-            email=parts[0],
-            password=parts[1],
-            birthday=parts[2],
-            created_at=datetime.fromisoformat(parts[3])
+            email=email,
+            password=password,
+            birthday=birthday,
+            created_at=datetime.fromisoformat(created_at)
         )
+
+
+# Field names resolved once per class; dataclasses.asdict walks the field
+# definitions and deep-copies values on every call.
+_FIELD_NAMES = {
+    cls.__name__: tuple(f.name for f in fields(cls))
+    for cls in (UserData, AccountRecord)
+}
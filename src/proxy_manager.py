@@ -5,14 +5,86 @@ Handles proxy generation, validation, and US region filtering.
 """
 
 import random
+import threading
 import time
-from typing import Optional
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from typing import List, Optional
 import requests
 
 from src.config import Config
 from src.models import ProxyValidationResult
 
 
+class ProxyPool:
+    """Pool of validated proxies stored as parallel columns.
+    
+    URLs, latencies and validity flags are kept in parallel arrays rather
+    than a list of ProxyValidationResult objects, so picking the fastest
+    usable proxy scans two compact buffers instead of per-object attributes.
+    Invalid results are not stored. All methods are thread-safe.
+    """
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._urls: List[str] = []
+        self._latencies = array("d")
+        self._is_valid = array("b")
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        """Number of usable (valid US) proxies in the pool."""
+        with self._lock:
+            return sum(self._is_valid)
+    
+    def add(self, proxy_url: str, result: ProxyValidationResult) -> None:
+        """Record the validation result for a proxy; invalid results are dropped.
+        
+        Args:
+            proxy_url: The validated proxy URL
+            result: Its validation result
+        """
+        if not result.is_valid:
+            return
+        
+        with self._lock:
+            self._urls.append(proxy_url)
+            self._latencies.append(result.latency_ms)
+            self._is_valid.append(1)
+    
+    def _best_index(self) -> Optional[int]:
+        """Index of the lowest-latency usable proxy, or None if there is none."""
+        candidates = compress(range(len(self._urls)), self._is_valid)
+        return min(candidates, key=self._latencies.__getitem__, default=None)
+    
+    def best_proxy(self) -> Optional[str]:
+        """Get the lowest-latency usable proxy without removing it.
+        
+        Returns:
+            Proxy URL, or None if the pool has no usable proxy
+        """
+        with self._lock:
+            idx = self._best_index()
+            return None if idx is None else self._urls[idx]
+    
+    def pop_best(self) -> Optional[str]:
+        """Remove and return the lowest-latency usable proxy.
+        
+        Returns:
+            Proxy URL, or None if the pool has no usable proxy
+        """
+        with self._lock:
+            idx = self._best_index()
+            if idx is None:
+                return None
+            
+            proxy_url = self._urls.pop(idx)
+            del self._latencies[idx]
+            del self._is_valid[idx]
+            return proxy_url
+
+
 class ProxyManager:
     """Manages proxy generation, validation, and selection."""
     
@@ -27,6 +99,13 @@ class ProxyManager:
             config: Configuration object. Uses default if not provided.
         """
         self.config = config or Config()
+        self._good_pool = ProxyPool()
+        
+        # A single-port range always yields the same URL
+        if self.config.PROXY_PORT_MIN == self.config.PROXY_PORT_MAX:
+            self._fixed_proxy = f"http://{self.config.PROXY_IP}:{self.config.PROXY_PORT_MIN}"
+        else:
+            self._fixed_proxy = None
     
     def generate_proxy(self) -> str:
         """Generate a proxy URL with random port.
@@ -36,7 +115,10 @@ class ProxyManager:
             
         Requirements: 2.1
         """
-        port = random.randint(self.config.PROXY_PORT_MIN, self.config.PROXY_PORT_MAX)
+        if self._fixed_proxy:
+            return self._fixed_proxy
+        
+        port = random.randrange(self.config.PROXY_PORT_MIN, self.config.PROXY_PORT_MAX + 1)
         return f"http://{self.config.PROXY_IP}:{port}"
     
     def validate_proxy(self, proxy_url: str) -> ProxyValidationResult:
@@ -96,14 +178,47 @@ class ProxyManager:
                 region=""
             )
     
+    def warmup_pool(self, n: int = 50) -> int:
+        """Validate a batch of proxies concurrently and keep the US ones.
+        
+        Validation is dominated by network wait, so running the checks on a
+        thread pool lets a whole port range be probed in roughly the time of
+        a single request. Valid proxies are kept for get_valid_us_proxy.
+        
+        Args:
+            n: Number of proxies to generate and validate
+            
+        Returns:
+            Number of valid US proxies added to the pool
+        """
+        if n <= 0:
+            return 0
+        
+        # Random ports repeat; validate each distinct URL once
+        proxy_urls = list(dict.fromkeys(self.generate_proxy() for _ in range(n)))
+        with ThreadPoolExecutor(max_workers=len(proxy_urls)) as executor:
+            results = list(executor.map(self.validate_proxy, proxy_urls))
+        
+        valid = [(proxy_url, result) for proxy_url, result in zip(proxy_urls, results)
+                 if result.is_valid]
+        for proxy_url, result in valid:
+            self._good_pool.add(proxy_url, result)
+        return len(valid)
+    
     def get_valid_us_proxy(self) -> Optional[str]:
         """Get a valid US proxy, retrying with different ports if needed.
         
+        Proxies collected by warmup_pool are handed out first, fastest first.
+        
         Returns:
             Valid US proxy URL, or None if no valid proxy found after max retries
             
         Requirements: 2.5
         """
+        pooled = self._good_pool.pop_best()
+        if pooled:
+            return pooled
+        
         for _ in range(self.MAX_RETRY_ATTEMPTS):
             proxy_url = self.generate_proxy()
             result = self.validate_proxy(proxy_url)
@@ -127,7 +242,7 @@ def generate_proxy_url(ip: str, port_min: int, port_max: int) -> str:
     Returns:
         Proxy URL in format http://{ip}:{port}
     """
-    port = random.randint(port_min, port_max)
+    port = random.randrange(port_min, port_max + 1)
     return f"http://{ip}:{port}"
 
 
@@ -5,13 +5,17 @@ Handles the complete registration flow including form filling,
 submission, and success verification.
 """
 
-from typing import Optional
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional
 import logging
+import threading
 import time
 
-from src.browser_controller import BrowserController
+from src.browser_controller import BrowserController, PlaywrightTimeoutError, matches_dynamic_id_pattern
 from src.models import UserData
-from src.manual_verification import ManualVerificationHandler, VerificationEvent
+from src.manual_verification import ManualVerificationHandler, VerificationEvent, poll_intervals
+from src.storage import CheckpointStore
 from src.config import config
 from datetime import datetime
 
@@ -29,18 +33,173 @@ PASSWORD_CONFIRM_BASE_PATTERN = "dwfrm_profile_login_passwordconfirm_"
 FIRSTNAME_SELECTOR = "#dwfrm_profile_customer_firstname"
 LASTNAME_SELECTOR = "#dwfrm_profile_customer_lastname"
 SUBMIT_BUTTON_SELECTOR = '[name="dwfrm_profile_confirm"]'
+PROFILE_LINK_SELECTOR = 'a[href*="/profile"]'
 
 # Timeouts
 NAVIGATION_TIMEOUT = 30000  # 30 seconds
+CHALLENGE_DETECTION_WINDOW = 2.0  # seconds after submit for a challenge to appear
 
 logger = logging.getLogger(__name__)
 
 
+def _poll(
+    fn: Callable[[], Any],
+    deadline: float,
+    initial: float = 0.05,
+    factor: float = 1.5,
+    cap: float = 0.5,
+    sleep: Optional[Callable[[float], None]] = None
+) -> Any:
+    """Call fn with backoff until it returns a truthy value.
+    
+    Polls fast at first (50 ms, 75 ms, ...) and backs off to cap, so an
+    early result is picked up almost immediately.
+    
+    Args:
+        fn: Zero-argument probe
+        deadline: Total time in seconds to spend waiting between probes
+        initial: First wait interval in seconds
+        factor: Multiplier applied after each wait
+        cap: Upper bound for any single wait in seconds
+        sleep: Function used to wait between probes (default time.sleep)
+        
+    Returns:
+        The first truthy result of fn, or its last result once the deadline is spent
+    """
+    sleep = sleep or time.sleep
+    waited = 0.0
+    for interval in poll_intervals(initial, factor, cap):
+        result = fn()
+        if result or waited >= deadline:
+            return result
+        interval = min(interval, deadline - waited)
+        sleep(interval)
+        waited += interval
+
+
 class RegistrationError(Exception):
     """Exception raised when registration fails."""
     pass
 
 
+class RegistrationState(Enum):
+    """Steps of the registration flow, in the order they are reached.
+    
+    NAVIGATED, FILLED and AWAITING_HUMAN describe the open page, so they only
+    live on the Registration instance. SUBMITTED means the account exists on
+    the site; it is persisted so a restarted run does not register it again.
+    """
+    NEW = "new"
+    NAVIGATED = "navigated"
+    FILLED = "filled"
+    AWAITING_HUMAN = "awaiting_human"
+    SUBMITTED = "submitted"
+    PROFILE = "profile"
+
+
+# States that outlive the browser page and are written to the checkpoint store
+DURABLE_STATES = frozenset({RegistrationState.SUBMITTED})
+
+
+class SubmitGate:
+    """Limits concurrent form submissions and spaces them out.
+    
+    Shared by the registrations of a run so that workers running in parallel on the
+    same IP do not fire submits in bursts, which raises the PerimeterX
+    challenge rate. Only the submit click is gated; navigation and form
+    filling stay parallel.
+    """
+    
+    def __init__(self, concurrency: int = 1, spacing: float = 0.0):
+        """Initialize SubmitGate.
+        
+        Args:
+            concurrency: Maximum number of submissions in flight at once
+            spacing: Minimum time in seconds between consecutive submissions
+        """
+        self.spacing = spacing
+        self._slots = threading.BoundedSemaphore(max(1, concurrency))
+        self._spacing_lock = threading.Lock()
+        self._last_submit: Optional[float] = None
+    
+    @contextmanager
+    def hold(self, sleep_fn: Optional[Callable[[float], None]] = None) -> Iterator["SubmitGate"]:
+        """Hold a submit slot, first waiting out the spacing since the last submit.
+        
+        Args:
+            sleep_fn: Function used to wait for the spacing (default time.sleep)
+        """
+        self._slots.acquire()
+        try:
+            if self.spacing > 0:
+                with self._spacing_lock:
+                    now = time.monotonic()
+                    if self._last_submit is not None:
+                        wait = self._last_submit + self.spacing - now
+                        if wait > 0:
+                            (sleep_fn or time.sleep)(wait)
+                            now += wait
+                    self._last_submit = now
+            yield self
+        finally:
+            self._slots.release()
+
+
+class SubmitDispatcher:
+    """Routes submissions to per-proxy SubmitGate shards.
+    
+    Submits through different egress IPs do not affect each other's
+    challenge rate, so serializing all of them behind one gate is needless
+    contention. Each proxy URL maps to one of N shards (N a power of two),
+    and every shard enforces its own concurrency and spacing. With one
+    shard this is the same as a single global SubmitGate.
+    """
+    
+    def __init__(self, shards: int = 1, concurrency: int = 1, spacing: float = 0.0):
+        """Initialize SubmitDispatcher.
+        
+        Args:
+            shards: Number of submit gates, must be a power of two
+            concurrency: Maximum submissions in flight per shard
+            spacing: Minimum time in seconds between submissions per shard
+            
+        Raises:
+            ValueError: If shards is not a positive power of two
+        """
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError(f"shards must be a positive power of two, got {shards}")
+        self._mask = shards - 1
+        self._gates = [SubmitGate(concurrency, spacing) for _ in range(shards)]
+    
+    def gate_for(self, proxy_url: Optional[str]) -> SubmitGate:
+        """Get the submit gate for a proxy.
+        
+        Args:
+            proxy_url: Proxy the submission goes through, or None for a direct connection
+            
+        Returns:
+            The SubmitGate shard assigned to the proxy
+        """
+        return self._gates[hash(proxy_url) & self._mask]
+
+
+# Used by registrations that are not given a dispatcher, e.g. through the
+# convenience functions; built from the global config on first use
+_default_dispatcher: Optional[SubmitDispatcher] = None
+_default_dispatcher_lock = threading.Lock()
+
+
+def _default_submit_dispatcher() -> SubmitDispatcher:
+    """Get the module's default submit dispatcher, creating it on first use."""
+    global _default_dispatcher
+    with _default_dispatcher_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = SubmitDispatcher(
+                config.SUBMIT_SHARDS, config.SUBMIT_CONCURRENCY, config.SUBMIT_SPACING_SEC
+            )
+        return _default_dispatcher
+
+
 class Registration:
     """Handles Ralph Lauren account registration flow.
     
@@ -48,30 +207,51 @@ class Registration:
     with verification of successful registration.
     """
     
-    def __init__(self, browser: BrowserController):
+    def __init__(self, browser: BrowserController, checkpoints: Optional[CheckpointStore] = None,
+                 sleep_fn: Optional[Callable[[float], None]] = None,
+                 submit_dispatcher: Optional[SubmitDispatcher] = None):
         """Initialize Registration module.
         
         Args:
             browser: BrowserController instance for browser automation
+            checkpoints: Optional store that persists durable progress per email
+            sleep_fn: Function used for waits, also handed to the manual
+                verification handler and the submit gate (default time.sleep)
+            submit_dispatcher: Dispatcher gating the submit click, shared by
+                the registrations of one run (default: the module default,
+                built from the global config)
         """
         self.browser = browser
+        self.checkpoints = checkpoints
+        self._sleep_fn = sleep_fn
+        self.submit_dispatcher = submit_dispatcher
+        self.state = RegistrationState.NEW
+        self._email: Optional[str] = None
 
     def navigate_to_registration(self) -> None:
         """Navigate to the registration page.
         
+        Returns as soon as the email input and submit button are rendered.
+        
+        Raises:
+            RegistrationError: If the form does not appear within NAVIGATION_TIMEOUT
+            
         Requirements: 4.1
         """
         logger.info(f"Navigating to registration page: {REGISTRATION_URL}")
         self.browser.navigate(REGISTRATION_URL)
         
-        # Wait for page to fully load
-        time.sleep(30)
+        # Wait until the form is ready instead of a fixed delay
+        for selector in (EMAIL_SELECTOR, SUBMIT_BUTTON_SELECTOR):
+            if not self.browser.wait_for_element(selector, timeout=NAVIGATION_TIMEOUT):
+                raise RegistrationError(f"Registration page did not load: {selector} not found")
     
     def fill_registration_form(self, user_data: UserData) -> None:
         """Fill the registration form with user data.
         
         Handles dynamic ID selectors for password fields that have
-        12-character random suffixes.
+        12-character random suffixes. With config.BATCH_FORM_FILL all fields
+        are filled in a single browser call instead of typed one by one.
         
         Args:
             user_data: UserData object containing registration information
@@ -83,36 +263,85 @@ class Registration:
         """
         logger.info(f"Filling registration form for: {user_data.email}")
         
+        if config.BATCH_FORM_FILL:
+            fields = [
+                (EMAIL_SELECTOR, user_data.email, False),
+                (PASSWORD_BASE_PATTERN, user_data.password, True),
+                (PASSWORD_CONFIRM_BASE_PATTERN, user_data.password, True),
+                (FIRSTNAME_SELECTOR, user_data.first_name, False),
+                (LASTNAME_SELECTOR, user_data.last_name, False),
+            ]
+            if not self.browser.fill_form_batch(fields):
+                raise RegistrationError("Registration form fields not found")
+            logger.info("Registration form filled successfully")
+            return
+        
         # Fill email field (Requirements 4.2)
-        if not self.browser.wait_for_element(EMAIL_SELECTOR):
-            raise RegistrationError("Email field not found")
-        self.browser.fill_input(EMAIL_SELECTOR, user_data.email)
+        self._fill_field(EMAIL_SELECTOR, user_data.email, "Email")
         logger.debug("Email field filled")
         
+        # Resolve both dynamic password IDs in one lookup
+        dynamic_ids = self.browser.resolve_dynamic_ids(
+            [PASSWORD_BASE_PATTERN, PASSWORD_CONFIRM_BASE_PATTERN]
+        )
+        
         # Fill password field with dynamic ID (Requirements 4.3)
-        if not self.browser.fill_input_by_dynamic_id(PASSWORD_BASE_PATTERN, user_data.password):
+        if not self._fill_dynamic_field(PASSWORD_BASE_PATTERN, user_data.password, dynamic_ids):
             raise RegistrationError("Password field not found")
         logger.debug("Password field filled")
         
         # Fill password confirmation with dynamic ID (Requirements 4.4)
-        if not self.browser.fill_input_by_dynamic_id(PASSWORD_CONFIRM_BASE_PATTERN, user_data.password):
+        if not self._fill_dynamic_field(PASSWORD_CONFIRM_BASE_PATTERN, user_data.password, dynamic_ids):
             raise RegistrationError("Password confirmation field not found")
         logger.debug("Password confirmation field filled")
         
         # Fill first name (Requirements 4.5)
-        if not self.browser.wait_for_element(FIRSTNAME_SELECTOR):
-            raise RegistrationError("First name field not found")
-        self.browser.fill_input(FIRSTNAME_SELECTOR, user_data.first_name)
+        self._fill_field(FIRSTNAME_SELECTOR, user_data.first_name, "First name")
         logger.debug("First name field filled")
         
         # Fill last name (Requirements 4.6)
-        if not self.browser.wait_for_element(LASTNAME_SELECTOR):
-            raise RegistrationError("Last name field not found")
-        self.browser.fill_input(LASTNAME_SELECTOR, user_data.last_name)
+        self._fill_field(LASTNAME_SELECTOR, user_data.last_name, "Last name")
         logger.debug("Last name field filled")
         
         logger.info("Registration form filled successfully")
+    
+    def _fill_field(self, selector: str, value: str, label: str) -> None:
+        """Fill a static-ID field, relying on Playwright's auto-waiting.
+        
+        Args:
+            selector: CSS selector of the field
+            value: Value to fill in
+            label: Field name used in the error message
+            
+        Raises:
+            RegistrationError: If the field does not become fillable in time
+        """
+        try:
+            self.browser.fill_input(selector, value, timeout=NAVIGATION_TIMEOUT)
+        except PlaywrightTimeoutError:
+            raise RegistrationError(f"{label} field not found")
 
+    def _fill_dynamic_field(self, base_pattern: str, value: str, dynamic_ids: dict) -> bool:
+        """Fill a dynamic-ID field, using its pre-resolved ID when available.
+        
+        Args:
+            base_pattern: Base ID pattern of the field
+            value: Value to fill in
+            dynamic_ids: Result of BrowserController.resolve_dynamic_ids
+            
+        Returns:
+            True if the field was found and filled, False otherwise
+            
+        Requirements: 4.3, 4.4
+        """
+        element_id = dynamic_ids.get(base_pattern)
+        if isinstance(element_id, str) and matches_dynamic_id_pattern(element_id, base_pattern):
+            self.browser.fill_input(f"#{element_id}", value)
+            return True
+        
+        # Not resolved up front; fall back to waiting for the prefix selector
+        return self.browser.fill_input_by_dynamic_id(base_pattern, value)
+    
     def submit_and_verify(self, timeout: Optional[int] = None) -> bool:
         """Submit the registration form and verify success.
         
@@ -138,24 +367,47 @@ class Registration:
             logger.error("Submit button not found")
             return False
         
-        self.browser.click_button(SUBMIT_BUTTON_SELECTOR)
-        logger.debug("Submit button clicked")
-        
-        # Wait a moment for potential PerimeterX challenge to appear
-        time.sleep(2)
+        # Capture the registration API response from the moment of the click,
+        # so it is not lost while challenge detection or verification runs
+        self.browser.arm_response_waiter(REGISTRATION_API_URL)
+        try:
+            dispatcher = self.submit_dispatcher or _default_submit_dispatcher()
+            gate = dispatcher.gate_for(getattr(self.browser, "proxy_url", None))
+            with gate.hold(self._sleep_fn):
+                self.browser.click_button(SUBMIT_BUTTON_SELECTOR)
+            logger.debug("Submit button clicked")
+            
+            return self._await_registration_result(timeout)
+        finally:
+            self.browser.stop_monitoring(REGISTRATION_API_URL)
+    
+    def _await_registration_result(self, timeout: int) -> bool:
+        """Handle any challenge after submit and wait for the registration response.
         
+        Args:
+            timeout: Maximum time to wait for the API response in milliseconds
+            
+        Returns:
+            True if the 302 registration response was received, False otherwise
+            
+        Requirements: 2.1, 2.2, 2.3, 4.8, 9.6
+        """
         # Initialize manual verification handler
         verification_handler = ManualVerificationHandler(
             self.browser, 
-            timeout=config.MANUAL_VERIFICATION_TIMEOUT
+            timeout=config.MANUAL_VERIFICATION_TIMEOUT,
+            sleep_fn=self._sleep_fn
         )
         
-        # Detect PerimeterX challenge (Requirements 2.1, 9.6)
-        challenge_type = verification_handler.detect_challenge()
+        # Detect PerimeterX challenge, giving it a short window to appear (Requirements 2.1, 9.6)
+        challenge_type = _poll(
+            verification_handler.detect_challenge, CHALLENGE_DETECTION_WINDOW, sleep=self._sleep_fn
+        )
         
         if challenge_type:
             # Challenge detected - enter manual verification mode (Requirements 2.1, 2.2, 2.3)
             logger.info(f"PerimeterX challenge detected: {challenge_type}")
+            self.state = RegistrationState.AWAITING_HUMAN
             
             # Create verification event
             event = VerificationEvent(
@@ -201,8 +453,10 @@ class Registration:
         if response_data:
             logger.info(f"Registration API response received - Status: {response_data['status']}")
             logger.info(f"Response URL: {response_data['url']}")
-            logger.debug(f"Response headers: {response_data['headers']}")
-            logger.debug(f"Response body: {response_data['body']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                # Headers and body are fetched lazily; only pay for them when logged
+                logger.debug(f"Response headers: {response_data['headers']()}")
+                logger.debug(f"Response body: {response_data['body']()}")
             logger.info("Registration successful - 302 redirect detected")
             return True
         else:
@@ -213,9 +467,25 @@ class Registration:
     def navigate_to_profile(self) -> None:
         """Navigate to the profile page after successful registration.
         
+        The post-registration redirect lands on the account page, which
+        links to the profile. Following that link avoids a second top-level
+        navigation; a direct navigation is only used when the link is not
+        available.
+        
         Requirements: 4.9
         """
         logger.info(f"Navigating to profile page: {PROFILE_URL}")
+        current_url = self.browser.current_url
+        if "/profile" in current_url:
+            logger.debug("Already on profile page")
+            return
+        
+        if SUCCESS_URL_PATTERN in current_url:
+            if self.browser.follow_link(PROFILE_LINK_SELECTOR, "**/profile**", timeout=NAVIGATION_TIMEOUT):
+                logger.debug("Reached profile page via account page link")
+                return
+            logger.debug("Profile link not usable, navigating directly")
+        
         self.browser.navigate(PROFILE_URL)
     
     def register(self, user_data: UserData) -> bool:
@@ -227,6 +497,11 @@ class Registration:
         3. Submit and verify success
         4. Navigate to profile page on success
         
+        The flow is a state machine (see RegistrationState). Calling register()
+        again for the same email after a failure resumes at the step that
+        failed instead of starting over, and an email the checkpoint store
+        already records as submitted skips straight to the profile step.
+        
         Args:
             user_data: UserData object containing registration information
             
@@ -235,28 +510,109 @@ class Registration:
             
         Requirements: 4.1-4.9
         """
+        if user_data.email != self._email:
+            self._email = user_data.email
+            self.state = self._load_checkpoint(user_data.email)
+        elif self.state is not RegistrationState.NEW:
+            logger.info(f"Resuming registration for {user_data.email} from state: {self.state.value}")
+        
         try:
+            if self.state is RegistrationState.AWAITING_HUMAN:
+                # Interrupted during manual verification; the page tells whether it went through
+                if SUCCESS_URL_PATTERN in self.browser.current_url:
+                    self._advance(RegistrationState.SUBMITTED)
+                else:
+                    self.state = RegistrationState.NEW
+            
             # Step 1: Navigate to registration page (Requirements 4.1)
-            self.navigate_to_registration()
+            if self.state is RegistrationState.NEW:
+                self.navigate_to_registration()
+                self._advance(RegistrationState.NAVIGATED)
             
             # Step 2: Fill the form (Requirements 4.2-4.6)
-            self.fill_registration_form(user_data)
+            if self.state is RegistrationState.NAVIGATED:
+                self.fill_registration_form(user_data)
+                self._advance(RegistrationState.FILLED)
             
             # Step 3: Submit and verify (Requirements 4.7, 4.8)
-            success = self.submit_and_verify()
+            if self.state is RegistrationState.FILLED:
+                if not self.submit_and_verify():
+                    # The submitted form is gone; a retry has to start from a fresh page
+                    self.state = RegistrationState.NEW
+                    return False
+                self._advance(RegistrationState.SUBMITTED)
             
             # Step 4: Navigate to profile on success (Requirements 4.9)
-            if success:
+            if self.state is RegistrationState.SUBMITTED:
                 self.navigate_to_profile()
+                self._advance(RegistrationState.PROFILE)
             
-            return success
+            return True
             
         except RegistrationError as e:
-            logger.error(f"Registration failed: {e}")
+            logger.error(f"Registration failed at state {self.state.value}: {e}")
             return False
         except Exception as e:
-            logger.error(f"Unexpected error during registration: {e}")
+            logger.error(f"Unexpected error during registration at state {self.state.value}: {e}")
             return False
+    
+    def _load_checkpoint(self, email: str) -> RegistrationState:
+        """Get the state to start from for an email.
+        
+        Args:
+            email: Account email
+            
+        Returns:
+            The persisted durable state, or NEW if there is none
+        """
+        if self.checkpoints is None:
+            return RegistrationState.NEW
+        
+        value = self.checkpoints.get(email)
+        try:
+            state = RegistrationState(value)
+        except ValueError:
+            return RegistrationState.NEW
+        
+        if state in DURABLE_STATES:
+            logger.info(f"Checkpoint found for {email}: {state.value}")
+            return state
+        return RegistrationState.NEW
+    
+    def _advance(self, state: RegistrationState) -> None:
+        """Move to a new state, persisting it if it is durable.
+        
+        Args:
+            state: State that was just reached
+        """
+        self.state = state
+        if state in DURABLE_STATES and self.checkpoints is not None:
+            self.checkpoints.set(self._email, state.value)
+
+
+# Registration used by the most recent convenience call
+_last_registration: Optional[Registration] = None
+
+
+def _registration_for(browser: BrowserController) -> Registration:
+    """Get a Registration for a browser, reusing the last one if it matches.
+    
+    Consecutive convenience calls on the same browser share one instance.
+    Only the most recent instance is kept, so a stopped browser is released
+    as soon as the helpers are called with another one.
+    
+    Args:
+        browser: BrowserController instance
+        
+    Returns:
+        Registration bound to the browser
+    """
+    global _last_registration
+    registration = _last_registration
+    if registration is None or registration.browser is not browser:
+        registration = Registration(browser)
+        _last_registration = registration
+    return registration
 
 
 def fill_registration_form(browser: BrowserController, user_data: UserData) -> None:
@@ -266,8 +622,7 @@ def fill_registration_form(browser: BrowserController, user_data: UserData) -> N
         browser: BrowserController instance
         user_data: UserData object containing registration information
     """
-    registration = Registration(browser)
-    registration.fill_registration_form(user_data)
+    _registration_for(browser).fill_registration_form(user_data)
 
 
 def submit_and_verify(browser: BrowserController, timeout: Optional[int] = None) -> bool:
@@ -280,5 +635,4 @@ def submit_and_verify(browser: BrowserController, timeout: Optional[int] = None)
     Returns:
         True if registration was successful, False otherwise
     """
-    registration = Registration(browser)
-    return registration.submit_and_verify(timeout)
+    return _registration_for(browser).submit_and_verify(timeout)
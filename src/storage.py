@@ -5,27 +5,94 @@ Handles saving and loading of successful account records.
 Uses append mode to preserve existing data.
 """
 
+import json
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set
 
 from src.models import AccountRecord
 from src.config import config
 
 
+def _release(fd: int, pending: bytearray) -> None:
+    """Write out pending bytes, then fsync and close the descriptor.
+    
+    Module-level so the finalizer holds no reference to the Storage itself.
+    """
+    if pending:
+        _write_all(fd, pending)
+        pending.clear()
+    os.fsync(fd)
+    os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 class Storage:
     """Storage handler for account records.
     
+    Keeps one append-only file descriptor open for the lifetime of the
+    storage instead of reopening the file per record. Records can be
+    buffered and written in batches, and fsync is amortized across writes.
+    Pending data is written out on flush(), close(), load_all(), when the
+    instance is garbage collected, or at interpreter exit. Safe to share
+    between threads.
+    
+    Saved emails are indexed in memory, so ``email in storage`` answers
+    without re-reading the file.
+    
     Attributes:
         file_path: Path to the storage file
+        flush_every: Number of records buffered before they are written
+        fsync_every: Number of writes between fsync calls
     """
     
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, flush_every: int = 1, fsync_every: int = 10):
         """Initialize storage with file path.
         
         Args:
             file_path: Path to storage file. Defaults to config.OUTPUT_FILE
+            flush_every: Records to buffer before writing (default 1, write immediately)
+            fsync_every: Writes between fsync calls (default 10)
         """
         self.file_path = Path(file_path or config.OUTPUT_FILE)
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self._fd: Optional[int] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._pending = bytearray()
+        self._pending_records = 0
+        self._unsynced_writes = 0
+        self._lock = threading.RLock()
+        self._emails: Set[str] = self._read_emails()
+    
+    def _read_emails(self) -> Set[str]:
+        """Collect the emails already in the storage file.
+        
+        Only the email field is read, so a torn or malformed line (e.g. a
+        partial last line after a crash) does not stop the storage opening.
+        """
+        if not self.file_path.exists():
+            return set()
+        
+        with open(self.file_path, "r", encoding="utf-8", errors="replace") as f:
+            return {line.strip().split("|", 1)[0] for line in f if line.strip()}
+    
+    def _open(self) -> int:
+        """Open the storage file for appending on first use."""
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+            self._fd = os.open(self.file_path, flags, 0o600)
+            self._finalizer = weakref.finalize(self, _release, self._fd, self._pending)
+        return self._fd
     
     def save_success(self, record: AccountRecord) -> None:
         """Save a successful account record to storage.
@@ -35,30 +102,170 @@ class Storage:
         Args:
             record: AccountRecord to save
         """
-        with open(self.file_path, "a", encoding="utf-8") as f:
-            f.write(record.to_line() + "\n")
+        line = (record.to_line() + "\n").encode("utf-8")
+        with self._lock:
+            self._pending += line
+            self._pending_records += 1
+            if self._pending_records >= self.flush_every:
+                self.flush()
+            self._emails.add(record.email)
     
-    def load_all(self) -> List[AccountRecord]:
-        """Load all account records from storage.
+    def contains(self, email: str) -> bool:
+        """Check whether an account with this email has already been saved.
         
+        Args:
+            email: Email address to look up
+            
         Returns:
-            List of AccountRecord objects, empty list if file doesn't exist
+            True if a record with the email exists in storage
+        """
+        return email in self._emails
+    
+    def __contains__(self, email: str) -> bool:
+        return self.contains(email)
+    
+    def flush(self) -> None:
+        """Write buffered records to the storage file.
+        
+        Each flush is a single append write, so records are never interleaved
+        with writes from other processes.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            
+            fd = self._open()
+            _write_all(fd, self._pending)
+            self._pending.clear()
+            self._pending_records = 0
+            
+            self._unsynced_writes += 1
+            if self._unsynced_writes >= self.fsync_every:
+                os.fsync(fd)
+                self._unsynced_writes = 0
+    
+    def close(self) -> None:
+        """Flush pending records, fsync and close the storage file.
+        
+        The storage can still be used afterwards; the file is reopened on the
+        next write.
+        """
+        with self._lock:
+            self.flush()
+            if self._finalizer is not None:
+                # Runs _release once: fsyncs and closes the descriptor
+                self._finalizer()
+                self._finalizer = None
+            self._fd = None
+            self._unsynced_writes = 0
+    
+    def iter_records(self) -> Iterator[AccountRecord]:
+        """Iterate over stored account records one line at a time.
+        
+        Yields:
+            AccountRecord objects in the order they were saved
         """
+        self.flush()
+        
         if not self.file_path.exists():
-            return []
+            return
         
-        records = []
         with open(self.file_path, "r", encoding="utf-8") as f:
             for line in f:
-                line = line.strip()
-                if line:
-                    records.append(AccountRecord.from_line(line))
-        return records
+                if line.strip():
+                    yield AccountRecord.from_line(line)
+    
+    def load_all(self) -> List[AccountRecord]:
+        """Load all account records from storage.
+        
+        Returns:
+            List of AccountRecord objects, empty list if file doesn't exist
+        """
+        return list(self.iter_records())
     
     def clear(self) -> None:
         """Clear all records from storage.
         
         Used primarily for testing purposes.
         """
-        if self.file_path.exists():
-            self.file_path.unlink()
+        with self._lock:
+            self.close()
+            if self.file_path.exists():
+                self.file_path.unlink()
+            self._emails.clear()
+
+
+class CheckpointStore:
+    """Persists how far the registration flow got for each email.
+    
+    A small JSON object mapping email to state name. It is rewritten
+    atomically on every change, so a crash never leaves a half-written file.
+    Safe to share between threads.
+    
+    Attributes:
+        file_path: Path to the checkpoint file
+    """
+    
+    def __init__(self, file_path: str = None):
+        """Initialize checkpoint store with file path.
+        
+        Args:
+            file_path: Path to checkpoint file. Defaults to config.CHECKPOINT_FILE
+        """
+        self.file_path = Path(file_path or config.CHECKPOINT_FILE)
+        self._states: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, str]:
+        """Read the checkpoint file on first use."""
+        if self._states is None:
+            try:
+                with open(self.file_path, "r", encoding="utf-8") as f:
+                    self._states = dict(json.load(f))
+            except (FileNotFoundError, ValueError, TypeError):
+                self._states = {}
+        return self._states
+    
+    def _write(self) -> None:
+        """Atomically replace the checkpoint file with the current states."""
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._states, f)
+        os.replace(tmp_path, self.file_path)
+    
+    def get(self, email: str) -> Optional[str]:
+        """Get the recorded state for an email.
+        
+        Args:
+            email: Account email
+            
+        Returns:
+            State name, or None if nothing is recorded
+        """
+        with self._lock:
+            return self._load().get(email)
+    
+    def set(self, email: str, state: str) -> None:
+        """Record the state reached for an email.
+        
+        Args:
+            email: Account email
+            state: State name
+        """
+        with self._lock:
+            states = self._load()
+            if states.get(email) != state:
+                states[email] = state
+                self._write()
+    
+    def discard(self, email: str) -> None:
+        """Forget an email, e.g. once its account has been saved.
+        
+        Args:
+            email: Account email
+        """
+        with self._lock:
+            states = self._load()
+            if email in states:
+                del states[email]
+                self._write()
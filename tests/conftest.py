@@ -0,0 +1,112 @@
+"""
+Shared pytest fixtures.
+
+Project classes are provided as session-scoped fixtures that import them on
+first use, so collecting or selecting tests does not import Playwright.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="session")
+def BrowserController():
+    """The BrowserController class."""
+    from src.browser_controller import BrowserController
+    return BrowserController
+
+
+@pytest.fixture(scope="session")
+def Registration():
+    """The Registration class."""
+    from src.registration import Registration
+    return Registration
+
+
+@pytest.fixture(scope="session")
+def ManualVerificationHandler():
+    """The ManualVerificationHandler class."""
+    from src.manual_verification import ManualVerificationHandler
+    return ManualVerificationHandler
+
+
+@pytest.fixture(scope="session")
+def VerificationEvent():
+    """The VerificationEvent class."""
+    from src.manual_verification import VerificationEvent
+    return VerificationEvent
+
+
+@pytest.fixture(scope="session")
+def BrowserCrashedError():
+    """The BrowserCrashedError exception class."""
+    from src.manual_verification import BrowserCrashedError
+    return BrowserCrashedError
+
+
+@pytest.fixture(scope="session")
+def BrowserClosedError():
+    """The BrowserClosedError exception class."""
+    from src.manual_verification import BrowserClosedError
+    return BrowserClosedError
+
+
+@pytest.fixture(scope="session")
+def UserData():
+    """The UserData class."""
+    from src.models import UserData
+    return UserData
+
+
+@pytest.fixture(scope="module")
+def user_data(UserData):
+    """User data shared by a module's tests. Treat as read-only."""
+    return UserData(
+        email="test@example.com",
+        first_name="John",
+        last_name="Doe",
+        password="TestPass123!",
+        phone_number="1234567890"
+    )
+
+
+@pytest.fixture(scope="module")
+def fake_config():
+    """Registration settings with default verification values.
+
+    Shared by a module's tests; treat as read-only and monkeypatch a separate
+    namespace for tests that need other values.
+    """
+    return SimpleNamespace(
+        MANUAL_VERIFICATION_TIMEOUT=120,
+        ENABLE_VERIFICATION_NOTIFICATIONS=True,
+        MAX_VERIFICATION_ATTEMPTS=3,
+        BATCH_FORM_FILL=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def _registration_patches(request):
+    """Patch src.registration.ManualVerificationHandler once per test module.
+
+    The patch is undone when the module's tests finish.
+    """
+    mocks = {'MockHandler': patch('src.registration.ManualVerificationHandler').start()}
+    request.addfinalizer(patch.stopall)
+    return mocks
+
+
+@pytest.fixture
+def patched_registration(_registration_patches, fake_config, monkeypatch):
+    """Registration collaborators replaced for one test.
+
+    Returns:
+        Dict with 'MockHandler' (the patched ManualVerificationHandler class,
+        reset so it has no recorded calls, return values or side effects)
+        and 'config' (fake_config, installed as src.registration.config).
+    """
+    mock_handler_class = _registration_patches['MockHandler']
+    mock_handler_class.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr('src.registration.config', fake_config)
+    return {'MockHandler': mock_handler_class, 'config': fake_config}
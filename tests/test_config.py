@@ -34,6 +34,11 @@ class TestConfigDefaults:
         """
         config = Config()
         assert config.MAX_VERIFICATION_ATTEMPTS == 3
+        
+    def test_batch_form_fill_default(self):
+        """Test BATCH_FORM_FILL is off by default so fields are typed."""
+        config = Config()
+        assert config.BATCH_FORM_FILL is False
 
 
 class TestCustomConfiguration:
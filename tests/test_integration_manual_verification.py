@@ -7,199 +7,291 @@ Tests complete registration flows with manual verification, including:
 - Timeout scenarios
 - Flow recovery after verification
 
+Tests share no mutable state, so the module can run in parallel with
+`pytest -n auto`.
+
 Requirements: All requirements from manual-verification spec
 """
 
 import pytest
 import time
-from unittest.mock import Mock, PropertyMock, patch, MagicMock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
-from src.registration import Registration
-from src.manual_verification import ManualVerificationHandler, VerificationEvent
-from src.browser_controller import BrowserController
-from src.models import UserData
 
+# Fixed event start time, so event timestamps do not depend on the wall clock
+_FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
 
-# ============================================================================
-# Integration Test: Complete Registration Flow with Manual Verification
-# ============================================================================
+# Successful registration API response, shared read-only by every test
+_OK_RESPONSE = MappingProxyType({
+    'status': 302,
+    'url': 'https://www.ralphlauren.com/account',
+    'headers': lambda: {},
+    'body': lambda: ''
+})
 
-def test_complete_registration_flow_with_manual_verification():
+
+class _FastBrowser:
+    """Slotted stand-in for BrowserController.
+    
+    Attribute access is a plain slot lookup and assigning a name that is not
+    listed raises AttributeError, like Mock(spec_set=...) without the Mock
+    bookkeeping.
     """
-    End-to-end integration test for complete registration flow with manual verification.
-    
-    Tests the full flow:
-    1. Navigate to registration page
-    2. Fill registration form
-    3. Submit form
-    4. Detect PerimeterX challenge
-    5. Enter manual verification mode
-    6. Display notification to user
-    7. Wait for user to complete verification
-    8. Detect verification completion (URL change)
-    9. Resume automated flow
-    10. Monitor for registration API response
-    11. Verify registration success
+    __slots__ = (
+        'page', 'current_url', 'navigate', 'refresh', 'wait_for_element',
+        'click_button', 'fill_input', 'fill_input_by_dynamic_id',
+        'resolve_dynamic_ids', 'fill_form_batch', 'follow_link',
+        'arm_response_waiter', 'wait_for_response_with_data', 'stop_monitoring',
+    )
+
+
+def _locator_stub(count: int, visible: bool = True) -> SimpleNamespace:
+    """Plain stand-in for a Playwright locator matching `count` elements."""
+    return SimpleNamespace(
+        count=lambda: count,
+        first=SimpleNamespace(is_visible=lambda: visible, wait_for=lambda *args, **kwargs: None)
+    )
+
+
+# Locator for selectors that match nothing
+_EMPTY_LOCATOR = _locator_stub(0)
+
+# Locator for a visible challenge element
+_VISIBLE_LOCATOR = _locator_stub(1)
+
+
+def make_locator(locator_map=None, default=_EMPTY_LOCATOR):
+    """Build a page.locator replacement that is a dict lookup, not a Mock call.
     
-    Requirements: All requirements (1.1-9.6)
+    Args:
+        locator_map: Selector to locator stub; other selectors get `default`
+        default: Locator stub returned for unmapped selectors
     """
-    # Create mock browser and page
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
+    locator_map = locator_map or {}
+    return lambda selector: locator_map.get(selector, default)
+
+
+def make_fast_browser(**kw):
+    """Build a BrowserController stand-in for the registration flows.
     
-    # Mock form filling methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.fill_input = Mock()
-    mock_browser.fill_input_by_dynamic_id = Mock(return_value=True)
-    mock_browser.click_button = Mock()
+    Every slot not given in `kw` is a fresh Mock. By default the page is a
+    plain namespace whose locator matches nothing, elements are always found
+    and dynamic-ID fields always fill.
+    """
+    kw.setdefault('page', SimpleNamespace(locator=make_locator()))
+    kw.setdefault('wait_for_element', Mock(return_value=True))
+    kw.setdefault('fill_input_by_dynamic_id', Mock(return_value=True))
+    browser = _FastBrowser()
+    for name in _FastBrowser.__slots__:
+        setattr(browser, name, kw.get(name, Mock()))
+    return browser
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    """Make time.sleep return at once for every test in this module.
     
-    # Create test user data
-    user_data = UserData(
-        email="test@example.com",
-        password="TestPass123",
-        first_name="John",
-        last_name="Doe",
-        phone_number="+1234567890"
-    )
+    time.time advances by the slept amount instead, so timeout loops still
+    expire without a busy wait.
+    """
+    clock = [time.time()]
     
-    # Create registration instance
-    registration = Registration(mock_browser)
+    def sleep(seconds):
+        clock[0] += seconds
     
-    # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Simulate challenge detection
-        mock_handler.detect_challenge.return_value = "captcha"
-        
-        # Simulate successful manual verification
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        # Mock config
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            
-            # Mock successful API response
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            # Mock time.sleep to speed up test
-            with patch('time.sleep'):
-                # Execute registration flow
-                result = registration.submit_and_verify()
-    
-    # Verify the complete flow executed correctly
-    assert result is True
+    with patch('time.sleep', new=sleep), patch('time.time', new=lambda: clock[0]):
+        yield
+
+
+@pytest.fixture
+def mock_browser():
+    """Browser stand-in on the registration page."""
+    return make_fast_browser(current_url="https://www.ralphlauren.com/register")
+
+
+@pytest.fixture
+def handler(ManualVerificationHandler, mock_browser):
+    """ManualVerificationHandler on mock_browser with the default 120s timeout.
     
-    # Verify challenge detection was called
-    assert mock_handler.detect_challenge.called
+    Tests that need other settings adjust the attributes directly.
+    """
+    return ManualVerificationHandler(mock_browser, timeout=120)
+
+
+@pytest.fixture
+def make_event(VerificationEvent):
+    """Factory for VerificationEvents.
     
-    # Verify notification was displayed
-    assert mock_handler.display_notification.called
-    notification_call = mock_handler.display_notification.call_args
-    assert notification_call[0][0] == "captcha"
+    Defaults to a captcha started at _FROZEN_NOW on the registration page;
+    keyword arguments override any field.
+    """
+    def _make(**overrides):
+        fields = dict(
+            challenge_type="captcha",
+            start_time=_FROZEN_NOW,
+            page_url="https://www.ralphlauren.com/register"
+        )
+        fields.update(overrides)
+        return VerificationEvent(**fields)
+    return _make
+
+
+@pytest.fixture
+def verification_event(make_event):
+    """Captcha event with the make_event defaults."""
+    return make_event()
+
+
+@pytest.fixture
+def mock_mv_logger():
+    """Patch the manual verification module logger for the whole test."""
+    with patch('src.manual_verification.logger') as mock_logger:
+        yield mock_logger
+
+
+@pytest.fixture(scope="module")
+def StubRegistration(Registration):
+    """Registration subclass whose __init__ only sets what submit_and_verify reads.
     
-    # Verify manual verification wait was called
-    assert mock_handler.wait_for_manual_verification.called
+    Waits are no-ops. Tests that exercise the real constructor or the full
+    register() state machine use Registration instead.
+    """
+    from src.registration import SubmitDispatcher
     
-    # Verify logging was called
-    assert mock_handler.log_event.call_count >= 2
+    class _StubRegistration(Registration):
+        def __init__(self, browser):
+            self.browser = browser
+            self.checkpoints = None
+            self._sleep_fn = lambda *_: None
+            self.submit_dispatcher = SubmitDispatcher()
     
-    # Verify API response monitoring was called after verification
-    assert mock_browser.wait_for_response_with_data.called
+    return _StubRegistration
 
 
+@pytest.fixture
+def submit_and_verify_env(patched_registration, mock_browser, StubRegistration, monkeypatch):
+    """StubRegistration wired for a submit_and_verify run that hits one captcha.
+    
+    The handler mock detects a captcha and verification succeeds, the
+    registration API answers with _OK_RESPONSE, and src.registration.config
+    is a fresh namespace the test may change.
+    
+    Returns:
+        Namespace with registration, MockHandler, mock_handler and config
+    """
+    config = SimpleNamespace(
+        MANUAL_VERIFICATION_TIMEOUT=120,
+        ENABLE_VERIFICATION_NOTIFICATIONS=True,
+        MAX_VERIFICATION_ATTEMPTS=3,
+    )
+    monkeypatch.setattr('src.registration.config', config)
+    
+    MockHandler = patched_registration['MockHandler']
+    mock_handler = MockHandler.return_value
+    mock_handler.detect_challenge.return_value = "captcha"
+    mock_handler.wait_for_manual_verification.return_value = True
+    
+    mock_browser.wait_for_response_with_data = Mock(return_value=_OK_RESPONSE)
+    
+    return SimpleNamespace(
+        registration=StubRegistration(mock_browser),
+        MockHandler=MockHandler,
+        mock_handler=mock_handler,
+        config=config,
+    )
+
+
+def assert_handler_flow(mock_handler, *, challenges):
+    """Assert the handler saw one full verification per challenge.
+    
+    Groups mock_handler.mock_calls by method name in a single pass and
+    checks detection, notification, verification wait and start/completion
+    logging against that snapshot.
+    
+    Args:
+        mock_handler: ManualVerificationHandler mock used by the registration
+        challenges: Challenge types in the order they were detected
+    """
+    by_name = {}
+    for call in mock_handler.mock_calls:
+        by_name.setdefault(call[0], []).append(call)
+    assert len(by_name.get('detect_challenge', [])) == len(challenges)
+    assert len(by_name.get('wait_for_manual_verification', [])) == len(challenges)
+    assert [call[1][0] for call in by_name.get('display_notification', [])] == challenges
+    assert len(by_name.get('log_event', [])) >= 2 * len(challenges)
+
+
+def test_fast_browser_matches_browser_controller(BrowserController):
+    """
+    _FastBrowser only exposes BrowserController members.
+    
+    The class is inspected once here instead of once per spec'd mock.
+    """
+    members = set(dir(BrowserController))
+    assert set(_FastBrowser.__slots__) <= members
 
 
 # ============================================================================
-# Integration Test: Multiple Challenge Scenarios
+# Integration Test: Complete Registration Flow with Manual Verification
 # ============================================================================
 
-def test_multiple_challenges_in_single_flow():
+@pytest.mark.parametrize("challenges", [
+    ["captcha"],
+    ["captcha", "press-and-hold"],
+    ["captcha", "checkbox", "slider"],
+])
+def test_challenge_flow(patched_registration, challenges, StubRegistration):
     """
-    Integration test for handling multiple PerimeterX challenges in a single flow.
+    End-to-end integration test for registration submits that each hit a challenge.
     
-    Tests scenario where:
-    1. First challenge appears after registration submission
-    2. User completes first verification
-    3. Second challenge appears after profile update
-    4. User completes second verification
-    5. Flow completes successfully
+    Tests the flow for every submit:
+    1. Submit form
+    2. Detect PerimeterX challenge
+    3. Enter manual verification mode
+    4. Display notification to user
+    5. Wait for user to complete verification
+    6. Resume automated flow
+    7. Monitor for registration API response
+    8. Verify registration success
     
-    Requirements: 8.1, 8.2, 8.3, 8.4
+    With several submits, each challenge is handled independently with its
+    own detection, notification, verification wait and logging.
+    
+    Requirements: All requirements (1.1-9.6), 8.1, 8.2, 8.3, 8.4
     """
     # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
-    
-    # Mock browser methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.click_button = Mock()
+    mock_browser = make_fast_browser(current_url="https://www.ralphlauren.com/register")
     
     # Create registration instance
-    registration = Registration(mock_browser)
+    registration = StubRegistration(mock_browser)
     
-    # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Simulate two challenges detected in sequence
-        challenge_calls = ["captcha", "press-and-hold"]
-        mock_handler.detect_challenge.side_effect = challenge_calls
-        
-        # Both verifications succeed
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        # Mock config
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            mock_config.MAX_VERIFICATION_ATTEMPTS = 3
-            
-            # Mock API responses
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            # Mock time.sleep
-            with patch('time.sleep'):
-                # First submission (first challenge)
-                result1 = registration.submit_and_verify()
-                
-                # Simulate second challenge scenario
-                mock_browser.current_url = "https://www.ralphlauren.com/profile"
-                result2 = registration.submit_and_verify()
-    
-    # Verify both submissions succeeded
-    assert result1 is True
-    assert result2 is True
-    
-    # Verify challenge detection was called twice
-    assert mock_handler.detect_challenge.call_count == 2
-    
-    # Verify manual verification was called twice
-    assert mock_handler.wait_for_manual_verification.call_count == 2
-    
-    # Verify notifications were displayed for both challenges
-    assert mock_handler.display_notification.call_count == 2
-
-
-def test_max_verification_attempts_exceeded():
+    # One challenge per submit, all verifications succeed
+    mock_handler = patched_registration['MockHandler'].return_value
+    mock_handler.detect_challenge.side_effect = challenges
+    mock_handler.wait_for_manual_verification.return_value = True
+    
+    # Mock successful API response
+    mock_browser.wait_for_response_with_data = Mock(return_value=_OK_RESPONSE)
+    
+    for _ in challenges:
+        assert registration.submit_and_verify() is True
+    
+    # Verify each challenge was handled and logged independently
+    assert_handler_flow(mock_handler, challenges=challenges)
+    
+    # Verify API response monitoring was called after each verification
+    assert mock_browser.wait_for_response_with_data.call_count == len(challenges)
+
+
+
+
+# ============================================================================
+# Integration Test: Multiple Challenge Scenarios
+# ============================================================================
+
+def test_max_verification_attempts_exceeded(handler):
     """
     Integration test for exceeding maximum verification attempts.
     
@@ -211,17 +303,11 @@ def test_max_verification_attempts_exceeded():
     
     Requirements: 8.3, 8.4
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Create handler with max_attempts=3
-    handler = ManualVerificationHandler(mock_browser, timeout=120, max_attempts=3)
+    # Allow three attempts
+    handler.max_attempts = 3
     
     # Simulate 4 verification attempts
-    for i in range(4):
-        handler.increment_verification_count()
+    handler.verification_count = 4
     
     # Verify count is 4
     assert handler.verification_count == 4
@@ -230,84 +316,13 @@ def test_max_verification_attempts_exceeded():
     assert handler.check_max_attempts_exceeded() is True
 
 
-def test_independent_challenge_handling():
-    """
-    Integration test for independent handling of multiple challenges.
-    
-    Tests that each challenge is handled independently with its own:
-    - Detection
-    - Notification
-    - Verification wait
-    - Logging
-    
-    Requirements: 8.2
-    """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
-    
-    # Mock browser methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.click_button = Mock()
-    
-    # Create registration instance
-    registration = Registration(mock_browser)
-    
-    # Track events for each challenge
-    challenge_events = []
-    
-    # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Different challenge types
-        challenge_types = ["captcha", "checkbox", "slider"]
-        mock_handler.detect_challenge.side_effect = challenge_types
-        
-        # All verifications succeed
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        # Mock config
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            
-            # Mock API response
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            # Mock time.sleep
-            with patch('time.sleep'):
-                # Handle three challenges
-                for i in range(3):
-                    result = registration.submit_and_verify()
-                    assert result is True
-    
-    # Verify each challenge was handled independently
-    assert mock_handler.detect_challenge.call_count == 3
-    assert mock_handler.display_notification.call_count == 3
-    assert mock_handler.wait_for_manual_verification.call_count == 3
-    
-    # Verify different challenge types were displayed
-    notification_calls = mock_handler.display_notification.call_args_list
-    displayed_types = [call[0][0] for call in notification_calls]
-    assert displayed_types == challenge_types
-
-
 
 
 # ============================================================================
 # Integration Test: Timeout Scenarios
 # ============================================================================
 
-def test_verification_timeout_scenario():
+def test_verification_timeout_scenario(patched_registration, StubRegistration):
     """
     Integration test for verification timeout scenario.
     
@@ -321,59 +336,36 @@ def test_verification_timeout_scenario():
     Requirements: 4.1, 4.2, 4.3, 4.4, 4.5
     """
     # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
-    
-    # Mock browser methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.click_button = Mock()
+    mock_browser = make_fast_browser(current_url="https://www.ralphlauren.com/register")
     
     # Create registration instance
-    registration = Registration(mock_browser)
+    registration = StubRegistration(mock_browser)
     
     # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Challenge detected
-        mock_handler.detect_challenge.return_value = "captcha"
-        
-        # Verification times out
-        mock_handler.wait_for_manual_verification.return_value = False
-        
-        # Mock config
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            
-            # Mock time.sleep
-            with patch('time.sleep'):
-                # Execute registration flow
-                result = registration.submit_and_verify()
+    MockHandler = patched_registration['MockHandler']
+    mock_handler = MockHandler.return_value
     
-    # Verify registration failed due to timeout
-    assert result is False
+    # Challenge detected
+    mock_handler.detect_challenge.return_value = "captcha"
     
-    # Verify challenge detection was called
-    assert mock_handler.detect_challenge.called
+    # Verification times out
+    mock_handler.wait_for_manual_verification.return_value = False
     
-    # Verify notification was displayed
-    assert mock_handler.display_notification.called
+    # Execute registration flow
+    result = registration.submit_and_verify()
     
-    # Verify manual verification wait was called
-    assert mock_handler.wait_for_manual_verification.called
+    # Verify registration failed due to timeout
+    assert result is False
     
-    # Verify logging was called (including timeout event)
-    assert mock_handler.log_event.call_count >= 2
+    # Verify detection, notification, verification wait and logging
+    # (including the timeout event)
+    assert_handler_flow(mock_handler, challenges=["captcha"])
     
     # Verify API response monitoring was NOT called (timeout before that)
     # Note: wait_for_response_with_data should not be called on timeout
 
 
-def test_timeout_with_proper_cleanup():
+def test_timeout_with_proper_cleanup(handler, mock_browser, mock_mv_logger):
     """
     Integration test for timeout with proper resource cleanup.
     
@@ -384,35 +376,19 @@ def test_timeout_with_proper_cleanup():
     
     Requirements: 4.4, 4.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Create handler with short timeout
-    handler = ManualVerificationHandler(mock_browser, timeout=2)
-    
-    # Create verification event
-    event = VerificationEvent(
-        challenge_type="captcha",
-        start_time=datetime.now(),
-        page_url="https://www.ralphlauren.com/register"
-    )
+    mock_page = mock_browser.page
+    
+    # Use a short timeout
+    handler.timeout = 2
     
     # Mock URL that doesn't match
-    type(mock_browser).current_url = PropertyMock(return_value="https://www.ralphlauren.com/register")
+    mock_browser.current_url = "https://www.ralphlauren.com/register"
     
     # Mock challenge still present
-    mock_element = Mock()
-    mock_element.count.return_value = 1
-    mock_element.first = Mock()
-    mock_element.first.is_visible.return_value = True
-    mock_page.locator = Mock(return_value=mock_element)
+    mock_page.locator = make_locator(default=_VISIBLE_LOCATOR)
     
-    # Mock logger
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Wait for verification (will timeout)
-        result = handler.wait_for_manual_verification("/account/profile")
+    # Wait for verification (will timeout)
+    result = handler.wait_for_manual_verification("/account/profile")
     
     # Verify timeout occurred
     assert result is False
@@ -425,7 +401,7 @@ def test_timeout_with_proper_cleanup():
     assert handler.browser == mock_browser
 
 
-def test_timeout_error_message():
+def test_timeout_error_message(handler, verification_event, mock_mv_logger):
     """
     Integration test for timeout error message clarity.
     
@@ -436,31 +412,16 @@ def test_timeout_error_message():
     
     Requirements: 4.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
+    event = verification_event
     
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
-    # Create verification event
-    event = VerificationEvent(
-        challenge_type="captcha",
-        start_time=datetime.now(),
-        page_url="https://www.ralphlauren.com/register"
-    )
-    
-    # Mock logger to capture messages
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Log timeout
-        handler.log_verification_timeout(event, 120.0)
+    # Log timeout
+    handler.log_verification_timeout(event, 120.0)
     
     # Verify timeout was logged with warning level
-    assert mock_logger.warning.called
+    assert mock_mv_logger.warning.called
     
     # Verify log message contains required information
-    log_call = mock_logger.warning.call_args[0][0]
+    log_call = mock_mv_logger.warning.call_args[0][0]
     assert "[MANUAL_VERIFICATION]" in log_call
     assert "timed out" in log_call.lower()
     assert "120.0s" in log_call
@@ -477,7 +438,7 @@ def test_timeout_error_message():
 # Integration Test: Flow Recovery Scenarios
 # ============================================================================
 
-def test_flow_recovery_after_successful_verification():
+def test_flow_recovery_after_successful_verification(handler, mock_browser, make_event, mock_mv_logger):
     """
     Integration test for flow recovery after successful verification.
     
@@ -489,40 +450,20 @@ def test_flow_recovery_after_successful_verification():
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # URL matches expected pattern (verification succeeded)
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/account/profile"
-    )
-    
-    # No challenge elements present
-    mock_element = Mock()
-    mock_element.count.return_value = 0
-    mock_page.locator = Mock(return_value=mock_element)
-    
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
+    # URL matches expected pattern (verification succeeded); the default
+    # page has no challenge elements
+    mock_browser.current_url = "https://www.ralphlauren.com/account/profile"
     
     # Create successful verification event
-    event = VerificationEvent(
-        challenge_type="captcha",
-        start_time=datetime.now(),
-        page_url="https://www.ralphlauren.com/register"
-    )
+    event = make_event()
     event.complete(success=True)
     
-    # Mock logger
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Resume flow after verification
-        result = handler.resume_flow_after_verification(
-            event=event,
-            expected_url_pattern="/account/profile",
-            next_step="profile_update"
-        )
+    # Resume flow after verification
+    result = handler.resume_flow_after_verification(
+        event=event,
+        expected_url_pattern="/account/profile",
+        next_step="profile_update"
+    )
     
     # Verify flow resume succeeded
     assert result is True
@@ -531,16 +472,26 @@ def test_flow_recovery_after_successful_verification():
     # (verify_page_state is called internally)
     
     # Verify success was logged
-    assert mock_logger.info.called
-    log_calls = [str(call) for call in mock_logger.info.call_args_list]
-    log_messages = ' '.join(log_calls)
-    assert "Flow resuming" in log_messages or "resume" in log_messages.lower()
+    assert mock_mv_logger.info.called
+    info_calls = mock_mv_logger.info.call_args_list
+    # "resum" matches both "Flow resuming" and "resume"
+    assert any("resum" in str(call.args[0]).lower() for call in info_calls if call.args)
     
     # Verify monitoring setup was logged (debug level)
-    assert mock_logger.debug.called or "automation continuing" in log_messages.lower()
+    assert mock_mv_logger.debug.called or any(
+        "automation continuing" in str(call.args[0]).lower() for call in info_calls if call.args
+    )
 
 
-def test_flow_recovery_with_page_state_verification():
+@pytest.mark.parametrize("url,challenge_count,expected", [
+    # Valid state (URL matches, no challenges)
+    ("https://www.ralphlauren.com/account/profile", 0, True),
+    # Invalid state (URL doesn't match)
+    ("https://www.ralphlauren.com/other/page", 0, False),
+    # Invalid state (challenge still present)
+    ("https://www.ralphlauren.com/account/profile", 1, False),
+])
+def test_flow_recovery_with_page_state_verification(url, challenge_count, expected, handler):
     """
     Integration test for flow recovery with page state verification.
     
@@ -551,50 +502,17 @@ def test_flow_recovery_with_page_state_verification():
     
     Requirements: 5.1, 5.3
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Test case 1: Valid state (URL matches, no challenges)
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/account/profile"
+    # Fresh browser stub per case with a fixed URL and challenge count
+    handler.browser = SimpleNamespace(
+        current_url=url,
+        page=SimpleNamespace(locator=make_locator(default=_locator_stub(challenge_count)))
     )
     
-    mock_element = Mock()
-    mock_element.count.return_value = 0
-    mock_page.locator = Mock(return_value=mock_element)
-    
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
     # Verify page state
-    result = handler.verify_page_state("/account/profile")
-    assert result is True
-    
-    # Test case 2: Invalid state (URL doesn't match)
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/other/page"
-    )
-    
-    result = handler.verify_page_state("/account/profile")
-    assert result is False
-    
-    # Test case 3: Invalid state (challenge still present)
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/account/profile"
-    )
-    
-    mock_element_visible = Mock()
-    mock_element_visible.count.return_value = 1
-    mock_element_visible.first = Mock()
-    mock_element_visible.first.is_visible.return_value = True
-    mock_page.locator = Mock(return_value=mock_element_visible)
-    
-    result = handler.verify_page_state("/account/profile")
-    assert result is False
+    assert handler.verify_page_state("/account/profile") is expected
 
 
-def test_flow_recovery_with_subsequent_challenge_monitoring():
+def test_flow_recovery_with_subsequent_challenge_monitoring(handler, mock_browser, mock_mv_logger):
     """
     Integration test for monitoring subsequent challenges after recovery.
     
@@ -605,40 +523,20 @@ def test_flow_recovery_with_subsequent_challenge_monitoring():
     
     Requirements: 5.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
+    mock_page = mock_browser.page
     
     # Setup post-verification monitoring
-    with patch('src.manual_verification.logger') as mock_logger:
-        handler.setup_post_verification_monitoring()
+    handler.setup_post_verification_monitoring()
     
     # Verify monitoring setup was logged
-    assert mock_logger.debug.called
-    log_call = mock_logger.debug.call_args[0][0]
+    assert mock_mv_logger.debug.called
+    log_call = mock_mv_logger.debug.call_args[0][0]
     assert "monitoring" in log_call.lower()
     assert "subsequent" in log_call.lower()
     
     # Verify handler can still detect challenges
     # Mock a new challenge appearing
-    mock_element = Mock()
-    mock_element.count.return_value = 1
-    mock_element.first = Mock()
-    mock_element.first.wait_for = Mock()
-    
-    def locator_side_effect(selector):
-        if selector == '#px-captcha':
-            return mock_element
-        else:
-            empty = Mock()
-            empty.count.return_value = 0
-            return empty
-    
-    mock_page.locator = Mock(side_effect=locator_side_effect)
+    mock_page.locator = make_locator({'#px-captcha': _VISIBLE_LOCATOR})
     
     # Detect new challenge
     challenge_type = handler.detect_challenge()
@@ -647,7 +545,7 @@ def test_flow_recovery_with_subsequent_challenge_monitoring():
     assert challenge_type == "captcha"
 
 
-def test_complete_flow_with_recovery():
+def test_complete_flow_with_recovery(patched_registration, StubRegistration):
     """
     Integration test for complete flow including recovery.
     
@@ -663,11 +561,6 @@ def test_complete_flow_with_recovery():
     
     Requirements: All requirements (1.1-9.6)
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
     # Initial URL
     initial_url = "https://www.ralphlauren.com/register"
     success_url = "https://www.ralphlauren.com/account/profile"
@@ -682,62 +575,46 @@ def test_complete_flow_with_recovery():
             return url_sequence[idx]
         return success_url
     
-    type(mock_browser).current_url = PropertyMock(side_effect=get_current_url)
+    # Plain stub class: current_url is an ordinary property, local to this test
+    class _BrowserStub:
+        current_url = property(lambda self: get_current_url())
     
-    # Mock browser methods
+    # Create browser stub with the methods the submit flow uses
+    mock_browser = _BrowserStub()
     mock_browser.wait_for_element = Mock(return_value=True)
     mock_browser.click_button = Mock()
+    mock_browser.arm_response_waiter = Mock()
+    mock_browser.stop_monitoring = Mock()
     
     # Create registration instance
-    registration = Registration(mock_browser)
+    registration = StubRegistration(mock_browser)
     
     # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Challenge detected
-        mock_handler.detect_challenge.return_value = "captcha"
-        
-        # Verification succeeds (simulating URL change)
-        def wait_for_verification(expected_url_pattern):
-            # Advance URL sequence
-            url_index[0] += 1
-            return True
-        
-        mock_handler.wait_for_manual_verification.side_effect = wait_for_verification
-        
-        # Mock config
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            
-            # Mock API response
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': success_url,
-                'headers': {},
-                'body': ''
-            })
-            
-            # Mock challenge elements (disappear after verification)
-            mock_element = Mock()
-            mock_element.count.return_value = 0
-            mock_page.locator = Mock(return_value=mock_element)
-            
-            # Mock time.sleep
-            with patch('time.sleep'):
-                # Execute registration flow
-                result = registration.submit_and_verify()
+    MockHandler = patched_registration['MockHandler']
+    mock_handler = MockHandler.return_value
+    
+    # Challenge detected
+    mock_handler.detect_challenge.return_value = "captcha"
+    
+    # Verification succeeds (simulating URL change)
+    def wait_for_verification(expected_url_pattern):
+        # Advance URL sequence
+        url_index[0] += 1
+        return True
+    
+    mock_handler.wait_for_manual_verification.side_effect = wait_for_verification
+    
+    # Mock API response
+    mock_browser.wait_for_response_with_data = Mock(return_value=_OK_RESPONSE)
+    
+    # Execute registration flow
+    result = registration.submit_and_verify()
     
     # Verify complete flow succeeded
     assert result is True
     
     # Verify all steps were executed
-    assert mock_handler.detect_challenge.called
-    assert mock_handler.display_notification.called
-    assert mock_handler.wait_for_manual_verification.called
-    assert mock_handler.log_event.called
+    assert_handler_flow(mock_handler, challenges=["captcha"])
     assert mock_browser.wait_for_response_with_data.called
     
     # Verify URL progressed correctly
@@ -750,7 +627,7 @@ def test_complete_flow_with_recovery():
 # Integration Test: Error Handling Scenarios
 # ============================================================================
 
-def test_browser_crash_during_verification():
+def test_browser_crash_during_verification(handler, verification_event, mock_mv_logger, BrowserCrashedError):
     """
     Integration test for browser crash during verification.
     
@@ -762,32 +639,15 @@ def test_browser_crash_during_verification():
     
     Requirements: 4.4, 4.5
     """
-    from src.manual_verification import BrowserCrashedError
-    
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
-    # Create verification event
-    event = VerificationEvent(
-        challenge_type="captcha",
-        start_time=datetime.now(),
-        page_url="https://www.ralphlauren.com/register"
-    )
+    event = verification_event
     
-    # Mock logger
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Handle browser crash
-        with pytest.raises(BrowserCrashedError):
-            handler.handle_browser_crash(event)
+    # Handle browser crash
+    with pytest.raises(BrowserCrashedError):
+        handler.handle_browser_crash(event)
     
     # Verify failure was logged
-    assert mock_logger.error.called
-    log_call = mock_logger.error.call_args[0][0]
+    assert mock_mv_logger.error.called
+    log_call = mock_mv_logger.error.call_args[0][0]
     assert "Browser crashed" in log_call
     
     # Verify event was marked as failed
@@ -795,7 +655,7 @@ def test_browser_crash_during_verification():
     assert event.failure_reason == "browser_crashed"
 
 
-def test_browser_closed_by_user():
+def test_browser_closed_by_user(handler, verification_event, mock_mv_logger, BrowserClosedError):
     """
     Integration test for user closing browser during verification.
     
@@ -807,32 +667,15 @@ def test_browser_closed_by_user():
     
     Requirements: 4.4, 4.5
     """
-    from src.manual_verification import BrowserClosedError
-    
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
+    event = verification_event
     
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
-    # Create verification event
-    event = VerificationEvent(
-        challenge_type="captcha",
-        start_time=datetime.now(),
-        page_url="https://www.ralphlauren.com/register"
-    )
-    
-    # Mock logger
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Handle browser closed
-        with pytest.raises(BrowserClosedError):
-            handler.handle_browser_closed(event)
+    # Handle browser closed
+    with pytest.raises(BrowserClosedError):
+        handler.handle_browser_closed(event)
     
     # Verify failure was logged
-    assert mock_logger.warning.called
-    log_call = mock_logger.warning.call_args[0][0]
+    assert mock_mv_logger.warning.called
+    log_call = mock_mv_logger.warning.call_args[0][0]
     assert "closed browser" in log_call.lower()
     
     # Verify event was marked as failed
@@ -840,7 +683,13 @@ def test_browser_closed_by_user():
     assert event.failure_reason == "browser_closed_by_user"
 
 
-def test_page_state_mismatch_recovery():
+@pytest.mark.parametrize("current_url,expected", [
+    # URL matches expected after refresh
+    ("https://www.ralphlauren.com/account/profile", True),
+    # URL still doesn't match after refresh
+    ("https://www.ralphlauren.com/other/page", False),
+])
+def test_page_state_mismatch_recovery(current_url, expected, ManualVerificationHandler, mock_browser):
     """
     Integration test for page state mismatch recovery.
     
@@ -852,63 +701,30 @@ def test_page_state_mismatch_recovery():
     
     Requirements: 4.4, 4.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
     # Mock page.url for _check_browser_alive
-    mock_page.url = "https://www.ralphlauren.com/account/profile"
+    mock_browser.page.url = "https://www.ralphlauren.com/account/profile"
     
-    # Mock refresh method
-    mock_browser.refresh = Mock()
+    # URL after refresh
+    mock_browser.current_url = current_url
     
     # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
+    mock_sleep = Mock()
+    handler = ManualVerificationHandler(mock_browser, timeout=120, sleep_fn=mock_sleep)
     
-    # Test case 1: Recovery succeeds
-    # After refresh, URL matches expected
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/account/profile"
+    # Attempt recovery
+    result = handler.handle_page_state_mismatch(
+        expected_state="/account/profile",
+        actual_state="/other/page"
     )
     
-    # Mock time.sleep
-    with patch('time.sleep'):
-        # Attempt recovery
-        result = handler.handle_page_state_mismatch(
-            expected_state="/account/profile",
-            actual_state="/other/page"
-        )
+    assert result is expected
     
-    # Verify recovery succeeded
-    assert result is True
-    
-    # Verify refresh was called
-    assert mock_browser.refresh.called
-    
-    # Reset for test case 2
-    mock_browser.refresh.reset_mock()
-    
-    # Test case 2: Recovery fails
-    # URL doesn't match after refresh
-    type(mock_browser).current_url = PropertyMock(
-        return_value="https://www.ralphlauren.com/other/page"
-    )
-    
-    with patch('time.sleep'):
-        result = handler.handle_page_state_mismatch(
-            expected_state="/account/profile",
-            actual_state="/other/page"
-        )
-    
-    # Verify recovery failed
-    assert result is False
-    
-    # Verify refresh was still attempted
+    # Verify refresh was attempted and the page load wait went through the injected sleep
     assert mock_browser.refresh.called
+    mock_sleep.assert_called_with(2)
 
 
-def test_log_write_failure_fallback():
+def test_log_write_failure_fallback(handler, mock_mv_logger):
     """
     Integration test for log write failure with fallback.
     
@@ -919,21 +735,14 @@ def test_log_write_failure_fallback():
     
     Requirements: 4.4, 4.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
     # Verify fallback buffer is initially empty
     assert len(handler.get_fallback_logs()) == 0
     
-    # Mock logger to raise exception
-    with patch('src.manual_verification.logger') as mock_logger:
-        mock_logger.info.side_effect = Exception("Log write failed")
-        
-        # Attempt to log (should fallback)
-        handler._safe_log("Test message", "info")
+    # Make the logger raise
+    mock_mv_logger.info.side_effect = Exception("Log write failed")
+    
+    # Attempt to log (should fallback)
+    handler._safe_log("Test message", "info")
     
     # Verify message was added to fallback buffer
     fallback_logs = handler.get_fallback_logs()
@@ -949,7 +758,7 @@ def test_log_write_failure_fallback():
 # Integration Test: Configuration and Settings
 # ============================================================================
 
-def test_configuration_integration():
+def test_configuration_integration(submit_and_verify_env):
     """
     Integration test for configuration settings.
     
@@ -960,60 +769,29 @@ def test_configuration_integration():
     
     Requirements: 6.1, 6.2, 6.3
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
-    
-    # Mock browser methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.click_button = Mock()
+    env = submit_and_verify_env
     
-    # Create registration instance
-    registration = Registration(mock_browser)
+    # Test with custom config values
+    env.config.MANUAL_VERIFICATION_TIMEOUT = 180
+    env.config.ENABLE_VERIFICATION_NOTIFICATIONS = False
+    env.config.MAX_VERIFICATION_ATTEMPTS = 5
     
-    # Mock ManualVerificationHandler
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        
-        # Challenge detected
-        mock_handler.detect_challenge.return_value = "captcha"
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        # Test with custom config values
-        with patch('src.registration.config') as mock_config:
-            # Custom configuration
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 180
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = False
-            mock_config.MAX_VERIFICATION_ATTEMPTS = 5
-            
-            # Mock API response
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            # Mock time.sleep
-            with patch('time.sleep'):
-                # Execute flow
-                result = registration.submit_and_verify()
+    # Execute flow
+    result = env.registration.submit_and_verify()
     
     # Verify flow succeeded
     assert result is True
     
     # Verify handler was created with custom timeout
-    handler_call = MockHandler.call_args
+    handler_call = env.MockHandler.call_args
     assert handler_call[1]['timeout'] == 180
     
     # Verify notification was NOT displayed (disabled in config)
-    assert not mock_handler.display_notification.called
+    assert not env.mock_handler.display_notification.called
 
 
-def test_notification_toggle():
+@pytest.mark.parametrize("enabled,expected_displayed", [(True, True), (False, False)])
+def test_notification_toggle(submit_and_verify_env, enabled, expected_displayed):
     """
     Integration test for notification display toggle.
     
@@ -1023,66 +801,13 @@ def test_notification_toggle():
     
     Requirements: 6.2
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    mock_browser.current_url = "https://www.ralphlauren.com/register"
+    env = submit_and_verify_env
+    env.config.ENABLE_VERIFICATION_NOTIFICATIONS = enabled
     
-    # Mock browser methods
-    mock_browser.wait_for_element = Mock(return_value=True)
-    mock_browser.click_button = Mock()
+    result = env.registration.submit_and_verify()
     
-    # Test with notifications enabled
-    registration = Registration(mock_browser)
-    
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        mock_handler.detect_challenge.return_value = "captcha"
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = True
-            
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            with patch('time.sleep'):
-                result = registration.submit_and_verify()
-    
-    # Verify notification was displayed
-    assert mock_handler.display_notification.called
-    assert result is True
-    
-    # Test with notifications disabled
-    with patch('src.registration.ManualVerificationHandler') as MockHandler:
-        mock_handler = Mock()
-        MockHandler.return_value = mock_handler
-        mock_handler.detect_challenge.return_value = "captcha"
-        mock_handler.wait_for_manual_verification.return_value = True
-        
-        with patch('src.registration.config') as mock_config:
-            mock_config.MANUAL_VERIFICATION_TIMEOUT = 120
-            mock_config.ENABLE_VERIFICATION_NOTIFICATIONS = False
-            
-            mock_browser.wait_for_response_with_data = Mock(return_value={
-                'status': 302,
-                'url': 'https://www.ralphlauren.com/account',
-                'headers': {},
-                'body': ''
-            })
-            
-            with patch('time.sleep'):
-                result = registration.submit_and_verify()
-    
-    # Verify notification was NOT displayed
-    assert not mock_handler.display_notification.called
+    # Verify notification display follows the setting without affecting the flow
+    assert env.mock_handler.display_notification.called is expected_displayed
     assert result is True
 
 
@@ -1090,7 +815,7 @@ def test_notification_toggle():
 # Integration Test: Logging and Monitoring
 # ============================================================================
 
-def test_complete_logging_flow():
+def test_complete_logging_flow(handler, mock_mv_logger):
     """
     Integration test for complete logging flow.
     
@@ -1102,23 +827,13 @@ def test_complete_logging_flow():
     
     Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 2.5
     """
-    # Create mock browser
-    mock_browser = Mock(spec=BrowserController)
-    mock_page = Mock()
-    mock_browser.page = mock_page
-    
-    # Create handler
-    handler = ManualVerificationHandler(mock_browser, timeout=120)
-    
-    # Mock logger to capture all log calls
-    with patch('src.manual_verification.logger') as mock_logger:
-        # Log complete flow
-        event = handler.log_challenge_detection("captcha", "https://www.ralphlauren.com/register")
-        handler.log_verification_entry(120)
-        handler.log_verification_completion(event, 45.5)
+    # Log complete flow
+    event = handler.log_challenge_detection("captcha", "https://www.ralphlauren.com/register")
+    handler.log_verification_entry(120)
+    handler.log_verification_completion(event, 45.5)
     
     # Verify all logging methods were called
-    assert mock_logger.info.call_count >= 3
+    assert mock_mv_logger.info.call_count >= 3
     
     # Verify event has all required fields
     assert event.challenge_type == "captcha"
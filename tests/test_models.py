@@ -5,6 +5,7 @@ Uses hypothesis library for property-based testing.
 """
 
 import pytest
+from datetime import datetime
 from hypothesis import given, strategies as st, settings
 
 from src.models import UserData, AccountRecord
@@ -63,3 +64,17 @@ def test_user_data_json_round_trip(email, first_name, last_name, password, phone
     assert restored.last_name == original.last_name
     assert restored.password == original.password
     assert restored.phone_number == original.phone_number
+
+
+def test_account_record_line_round_trip_with_pipe_in_password():
+    """A password containing the field separator survives to_line/from_line."""
+    original = AccountRecord(
+        email="user@example.com",
+        password="pa|ss|word",
+        birthday="January 15",
+        created_at=datetime(2024, 1, 15, 10, 30)
+    )
+    
+    restored = AccountRecord.from_line(original.to_line() + "\n")
+    
+    assert restored == original
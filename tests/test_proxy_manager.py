@@ -5,10 +5,13 @@ Uses hypothesis library for property-based testing.
 """
 
 import re
+from unittest.mock import patch
+
 import pytest
 from hypothesis import given, strategies as st, settings
 
-from src.proxy_manager import generate_proxy_url, is_us_proxy
+from src.config import Config
+from src.proxy_manager import ProxyManager, ProxyPool, generate_proxy_url, is_us_proxy
 from src.models import ProxyValidationResult
 
 
@@ -94,3 +97,58 @@ def test_us_proxy_filter_correctness(country, latency, region):
         assert result is True, f"US proxy should be identified as valid US proxy"
     else:
         assert result is False, f"Non-US proxy (country={country}) should not be identified as US proxy"
+
+
+def test_warmup_pool_keeps_only_us_proxies():
+    """warmup_pool validates each distinct proxy once and pools the US ones."""
+    manager = ProxyManager(Config(PROXY_PORT_MIN=50000, PROXY_PORT_MAX=50020))
+    proxy_urls = [f"http://127.0.0.1:{port}" for port in range(50000, 50020)]
+
+    def fake_validate(proxy_url):
+        port = int(proxy_url.rsplit(":", 1)[1])
+        country = "US" if port % 2 == 0 else "CA"
+        return ProxyValidationResult(
+            is_valid=country == "US",
+            latency_ms=float(port % 7),
+            country=country,
+            region=""
+        )
+
+    with patch.object(manager, 'generate_proxy', side_effect=proxy_urls), \
+         patch.object(manager, 'validate_proxy', side_effect=fake_validate) as mock_validate:
+        added = manager.warmup_pool(n=20)
+
+        assert mock_validate.call_count == 20
+        assert added == 10 == len(manager._good_pool)
+
+        # Pooled proxies are returned fastest first without further validation
+        latencies = []
+        for _ in range(added):
+            proxy_url = manager.get_valid_us_proxy()
+            port = int(proxy_url.rsplit(":", 1)[1])
+            assert port % 2 == 0
+            latencies.append(port % 7)
+        assert latencies == sorted(latencies)
+        assert mock_validate.call_count == 20
+
+
+def test_proxy_pool_best_proxy_ignores_invalid():
+    """Invalid entries are dropped and best_proxy picks the lowest-latency valid one."""
+    pool = ProxyPool()
+    pool.add("http://a:1", ProxyValidationResult(is_valid=False, latency_ms=1.0, country="CA", region=""))
+    pool.add("http://b:2", ProxyValidationResult(is_valid=True, latency_ms=50.0, country="US", region=""))
+    pool.add("http://c:3", ProxyValidationResult(is_valid=True, latency_ms=20.0, country="US", region=""))
+
+    assert len(pool) == 2
+    assert "http://a:1" not in pool._urls
+    assert pool.best_proxy() == "http://c:3"
+    assert pool.pop_best() == "http://c:3"
+    assert pool.pop_best() == "http://b:2"
+    assert pool.pop_best() is None
+
+
+def test_generate_proxy_with_single_port_range():
+    """A single-port range always produces the same proxy URL."""
+    manager = ProxyManager(Config(PROXY_IP="10.0.0.1", PROXY_PORT_MIN=7897, PROXY_PORT_MAX=7897))
+
+    assert {manager.generate_proxy() for _ in range(5)} == {"http://10.0.0.1:7897"}
@@ -135,3 +135,121 @@ def test_storage_append_integrity(records_data):
     finally:
         # Cleanup
         Path(temp_path).unlink(missing_ok=True)
+
+
+def test_storage_buffered_writes_reach_file_on_flush_and_close():
+    """
+    Buffered records are written once flush_every is reached, on flush(),
+    and on close(); the file stays usable after close.
+    
+    **Validates: Requirements 6.1, 6.2**
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "accounts.txt"
+        storage = Storage(str(temp_path), flush_every=2)
+        
+        def record(i):
+            return AccountRecord(
+                email=f"user{i}@example.com",
+                password="password123",
+                birthday="January 1",
+                created_at=datetime(2024, 1, 1)
+            )
+        
+        storage.save_success(record(1))
+        assert not temp_path.exists()
+        
+        storage.save_success(record(2))
+        assert len(temp_path.read_text(encoding="utf-8").splitlines()) == 2
+        
+        storage.save_success(record(3))
+        storage.close()
+        assert len(temp_path.read_text(encoding="utf-8").splitlines()) == 3
+        
+        storage.save_success(record(4))
+        storage.save_success(record(5))
+        emails = [r.email for r in storage.load_all()]
+        assert emails == [f"user{i}@example.com" for i in range(1, 6)]
+        storage.close()
+
+
+def test_storage_indexes_saved_emails():
+    """
+    Saved emails are indexed in memory, including records already on disk
+    when the storage is opened, so duplicates can be skipped cheaply.
+    
+    **Validates: Requirements 6.1, 6.2**
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "accounts.txt"
+        existing = AccountRecord(
+            email="existing@example.com",
+            password="password123",
+            birthday="January 1",
+            created_at=datetime(2024, 1, 1)
+        )
+        temp_path.write_text(existing.to_line() + "\n", encoding="utf-8")
+        
+        storage = Storage(str(temp_path))
+        assert "existing@example.com" in storage
+        assert "new@example.com" not in storage
+        
+        storage.save_success(AccountRecord(
+            email="new@example.com",
+            password="password123",
+            birthday="January 2",
+            created_at=datetime(2024, 1, 2)
+        ))
+        assert storage.contains("new@example.com")
+        
+        storage.clear()
+        assert "existing@example.com" not in storage
+
+
+def test_storage_opens_file_with_torn_last_line():
+    """
+    A partial last line left by a crash does not stop the storage opening,
+    and the complete records before it are still indexed.
+    
+    **Validates: Requirements 6.1, 6.2**
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "accounts.txt"
+        existing = AccountRecord(
+            email="existing@example.com",
+            password="password123",
+            birthday="January 1",
+            created_at=datetime(2024, 1, 1)
+        )
+        temp_path.write_text(existing.to_line() + "\ntorn@example.com|pass", encoding="utf-8")
+        
+        storage = Storage(str(temp_path))
+        assert "existing@example.com" in storage
+        storage.close()
+
+
+def test_checkpoint_store_persists_states_across_instances():
+    """
+    Recorded states survive a new CheckpointStore on the same file, discarded
+    emails are gone, and an unreadable file is treated as empty.
+    
+    **Validates: Requirements 6.1**
+    """
+    from src.storage import CheckpointStore
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "checkpoints.json"
+        checkpoints = CheckpointStore(str(temp_path))
+        assert checkpoints.get("user@example.com") is None
+        
+        checkpoints.set("user@example.com", "submitted")
+        checkpoints.set("other@example.com", "submitted")
+        checkpoints.discard("other@example.com")
+        
+        reopened = CheckpointStore(str(temp_path))
+        assert reopened.get("user@example.com") == "submitted"
+        assert reopened.get("other@example.com") is None
+        assert not temp_path.with_name("checkpoints.json.tmp").exists()
+        
+        temp_path.write_text("{not json", encoding="utf-8")
+        assert CheckpointStore(str(temp_path)).get("user@example.com") is None